@@ -65,16 +65,48 @@ class IssuePriorityScorer:
         self, issue: Dict[str, Any], context: Optional[IssueContext] = None
     ) -> Dict[str, Any]:
         """Calculate comprehensive priority score for an issue"""
-        context = context or IssueContext()
+        return self.score_issues([issue], context)[0]
 
-        # Simple scoring for demo
-        severity = issue.get("severity", "medium")
-        frequency = issue.get("frequency", 0)
+    def score_issues(
+        self, issues: List[Dict[str, Any]], context: Optional[IssueContext] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate priority information for many issues at once
+
+        Scores are computed column by column (severity, frequency, total)
+        rather than issue by issue, so the per-factor lookups run in tight
+        comprehensions.
 
-        base_score = self.severity_scores.get(severity, 50)
-        frequency_bonus = min(frequency * 2, 30)
-        total_score = base_score + frequency_bonus
+        Args:
+            issues: Issues to score
+            context: Additional context for priority calculation
 
+        Returns:
+            Priority information for each issue, in input order
+        """
+        context = context or IssueContext()
+
+        # Simple scoring for demo
+        severity_lookup = self.severity_scores.get
+        base_scores = [
+            severity_lookup(issue.get("severity", "medium"), 50) for issue in issues
+        ]
+        frequency_bonuses = [
+            min(issue.get("frequency", 0) * 2, 30) for issue in issues
+        ]
+        total_scores = [
+            base + bonus for base, bonus in zip(base_scores, frequency_bonuses)
+        ]
+
+        return [
+            self._build_priority_info(base, bonus, total)
+            for base, bonus, total in zip(base_scores, frequency_bonuses, total_scores)
+        ]
+
+    def _build_priority_info(
+        self, base_score: int, frequency_bonus: int, total_score: int
+    ) -> Dict[str, Any]:
+        """Assemble the priority result for a single scored issue"""
         priority = Priority.from_score(int(total_score))
 
         return {
@@ -98,12 +130,12 @@ class IssuePriorityScorer:
         self, issues: List[Dict[str, Any]], context: Optional[IssueContext] = None
     ) -> List[Dict[str, Any]]:
         """Prioritize a batch of issues"""
-        prioritized_issues = []
+        priority_infos = self.score_issues(issues, context)
 
-        for issue in issues:
-            priority_info = self.calculate_priority(issue, context)
-            issue_with_priority = {**issue, **priority_info}
-            prioritized_issues.append(issue_with_priority)
+        prioritized_issues = [
+            {**issue, **priority_info}
+            for issue, priority_info in zip(issues, priority_infos)
+        ]
 
         prioritized_issues.sort(key=lambda x: x["total_score"], reverse=True)
         return prioritized_issues
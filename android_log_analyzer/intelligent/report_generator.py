@@ -99,12 +99,15 @@ class IntelligentReportGenerator:
 **Great news!** No critical issues were detected.
 """
 
-        section = f"""## 🚨 Critical Issues ({len(critical_issues)} found)
+        parts = [
+            f"""## 🚨 Critical Issues ({len(critical_issues)} found)
 
 """
+        ]
 
         for i, issue in enumerate(critical_issues[:3], 1):
-            section += f"""### {i}. {issue.get('type', 'Unknown').title()}
+            parts.append(
+                f"""### {i}. {issue.get('type', 'Unknown').title()}
 
 **Severity:** {issue.get('severity', 'Unknown').upper()}  
 **Frequency:** {issue.get('frequency', 0)} occurrences  
@@ -112,8 +115,9 @@ class IntelligentReportGenerator:
 
 ---
 """
+            )
 
-        return section
+        return "".join(parts)
 
     def _generate_recommendations(self, data: Dict[str, Any]) -> str:
         """Generate recommendations section"""
@@ -10,6 +10,7 @@ This module provides intelligent search capabilities including:
 
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -17,6 +18,13 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _compile_needles(needles: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile lowercase search terms into one alternation, longest first"""
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(re.escape(needle) for needle in ordered))
+
+
 class SearchType(Enum):
     """Types of search queries"""
 
@@ -77,28 +85,61 @@ class SmartSearchEngine:
         self, query: str, logs: List[str], max_results: int = 100
     ) -> List[SearchResult]:
         """Perform intelligent search across log lines"""
-        results = []
-        query_lower = query.lower()
+        return self.multi_search([query], logs, max_results)[query]
+
+    def multi_search(
+        self, queries: List[str], logs: List[str], max_results: int = 100
+    ) -> Dict[str, List[SearchResult]]:
+        """
+        Search for several queries in a single pass over the log lines
+
+        Each line is lowercased once and checked against one combined
+        pattern of all queries; only lines containing at least one query
+        are matched against the individual queries.
+
+        Args:
+            queries: Search queries
+            logs: Log lines to search
+            max_results: Maximum number of results per query
+
+        Returns:
+            Mapping of each query to its search results
+        """
+        results = {query: [] for query in queries}
+        pending = {query: query.lower() for query in queries}
+        if not pending:
+            return results
+
+        prefilter = _compile_needles(tuple(set(pending.values()))).search
 
         for i, line in enumerate(logs):
-            if query_lower in line.lower():
-                results.append(
+            line_lower = line.lower()
+            if not prefilter(line_lower):
+                continue
+
+            for query, query_lower in list(pending.items()):
+                start = line_lower.find(query_lower)
+                if start < 0:
+                    continue
+
+                matches = results[query]
+                matches.append(
                     SearchResult(
                         line_number=i + 1,
                         content=line,
                         relevance_score=1.0,
                         match_type=SearchType.EXACT,
                         context_lines=[],
-                        highlights=[
-                            (
-                                line.lower().find(query_lower),
-                                line.lower().find(query_lower) + len(query_lower),
-                            )
-                        ],
+                        highlights=[(start, start + len(query_lower))],
                     )
                 )
+                if len(matches) >= max_results:
+                    del pending[query]
+
+            if not pending:
+                break
 
-        return results[:max_results]
+        return {query: matches[:max_results] for query, matches in results.items()}
 
     def suggest_queries(self, partial_query: str) -> List[QuerySuggestion]:
         """Generate query suggestions"""
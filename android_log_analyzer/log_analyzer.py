@@ -11,14 +11,20 @@ and generates a summary report of its findings.
 
 import argparse
 import gzip
-import json
 import logging
 import os
 import re
+import sys
 import zipfile
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .utils import dumps_json
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +56,25 @@ except ImportError:
     ML_FEATURES_AVAILABLE = False
     logger.debug("ML features not available")
 
+
+# Shared engines, built on first use and reused across calls. Their
+# constructors compile patterns and (for ML) train models, which would
+# otherwise be repeated on every search, prioritization or ML analysis.
+@lru_cache(maxsize=1)
+def _get_search_engine() -> "SmartSearchEngine":
+    return SmartSearchEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_priority_scorer() -> "IssuePriorityScorer":
+    return IssuePriorityScorer()
+
+
+@lru_cache(maxsize=1)
+def _get_ml_analyzer() -> Dict[str, Any]:
+    return create_ml_analyzer()
+
+
 # --- Configuration for Issue Detection ---
 
 # ISSUE_PATTERNS defines the rules for detecting various log issues.
@@ -158,6 +183,29 @@ for issue_type, patterns in ISSUE_PATTERNS.items():
                 for key, regex_str in sub_patterns["extractors"].items():
                     sub_patterns["extractors"][key] = re.compile(regex_str)
 
+# Standard logcat line format, compiled once and shared by every parse call.
+# Regex breakdown:
+# ^(?P<timestamp>\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})  - Captures "MM-DD HH:MM:SS.mmm"
+# \s+                                                 - One or more spaces
+# (?P<pid>\d+)?                                       - Optional PID (digits)
+# \s+                                                 - One or more spaces
+# (?P<tid>\d+)?                                       - Optional TID (digits)
+# \s+                                                 - One or more spaces
+# (?P<level>[A-Z])                                    - Log level (single uppercase letter)
+# \s+                                                 - One or more spaces
+# (?P<tag>[^:]*)                                      - Log tag (any char except colon)
+# :\s*                                                - Colon, followed by zero or more spaces
+# (?P<message>.*)$                                    - The rest is the message
+LOG_LINE_PATTERN = re.compile(
+    r"^(?P<timestamp>\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s+"
+    r"(?P<pid>\d+)?\s+(?P<tid>\d+)?\s+"
+    r"(?P<level>[A-Z])\s+"
+    r"(?P<tag>[^:]*):\s*(?P<message>.*)$"
+)
+
+# Generic fallback used when the ANR "process_name" extractor fails
+_ANR_PROCESS_FALLBACK = re.compile(r"ANR in ([^ \(]+)")
+
 
 class LogEntry:
     """
@@ -222,25 +270,7 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
         ValueError: If the line format is completely invalid.
     """
     try:
-        # Regex breakdown:
-        # ^(?P<timestamp>\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})  - Captures "MM-DD HH:MM:SS.mmm"
-        # \s+                                                 - One or more spaces
-        # (?P<pid>\d+)?                                       - Optional PID (digits)
-        # \s+                                                 - One or more spaces
-        # (?P<tid>\d+)?                                       - Optional TID (digits)
-        # \s+                                                 - One or more spaces
-        # (?P<level>[A-Z])                                    - Log level (single uppercase letter)
-        # \s+                                                 - One or more spaces
-        # (?P<tag>[^:]*)                                      - Log tag (any char except colon)
-        # :\s*                                                - Colon, followed by zero or more spaces
-        # (?P<message>.*)$                                    - The rest is the message
-        log_pattern = re.compile(
-            r"^(?P<timestamp>\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s+"
-            r"(?P<pid>\d+)?\s+(?P<tid>\d+)?\s+"
-            r"(?P<level>[A-Z])\s+"
-            r"(?P<tag>[^:]*):\s*(?P<message>.*)$"
-        )
-        match = log_pattern.match(line.strip())
+        match = LOG_LINE_PATTERN.match(line.strip())
         if match:
             data = match.groupdict()
             # Convert PID and TID to integers if they exist, otherwise None
@@ -262,12 +292,74 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
         return None
 
 
-def iter_log_lines(filepath: Union[str, Path]) -> Iterator[str]:
+# Size of the reusable buffer used to read plain text logs
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _iter_plain_text_lines(
+    filepath: Path, chunk_size: int = _READ_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Yield lines from an uncompressed log file using large binary reads.
+
+    The file is read into one reusable buffer and decoded a chunk at a time
+    up to the last newline, instead of decoding and allocating line by line
+    through a text-mode file object. Splitting at a newline is always safe
+    for UTF-8 since 0x0A never occurs inside a multi-byte sequence.
+
+    Args:
+        filepath: Path to the plain text log file
+        chunk_size: Number of bytes to read per system call
+
+    Yields:
+        str: Individual log lines without line terminators
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    pending = b""
+
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            data = pending + view[:size]
+            cut = data.rfind(b"\n")
+            if cut < 0:
+                pending = data
+                continue
+            pending = data[cut + 1 :]
+            text = data[:cut].decode("utf-8", errors="ignore")
+            for line in text.split("\n"):
+                yield line.rstrip("\r")
+
+    if pending:
+        yield pending.decode("utf-8", errors="ignore").rstrip("\r")
+
+
+def _source_name(source: Union[str, Path, IO]) -> str:
+    """Return a printable name for a log file path or file-like object."""
+    if hasattr(source, "read"):
+        return str(getattr(source, "name", "<stream>"))
+    return str(source)
+
+
+def _iter_stream_lines(stream: IO) -> Iterator[str]:
+    """Yield lines from an open text or binary file-like object."""
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="ignore")
+        yield line.rstrip("\n\r")
+
+
+def iter_log_lines(filepath: Union[str, Path, IO]) -> Iterator[str]:
     """
     Yield log lines from plain text or compressed files (.gz or .zip).
 
     Args:
-        filepath: Path to the log file (supports .log, .txt, .gz, .zip)
+        filepath: Path to the log file (supports .log, .txt, .gz, .zip), or an
+                  already open text or binary file-like object such as
+                  io.StringIO / io.BytesIO
 
     Yields:
         str: Individual log lines
@@ -277,6 +369,10 @@ def iter_log_lines(filepath: Union[str, Path]) -> Iterator[str]:
         PermissionError: If the file can't be read
         zipfile.BadZipFile: If zip file is corrupted
     """
+    if hasattr(filepath, "read"):
+        yield from _iter_stream_lines(filepath)
+        return
+
     filepath = Path(filepath)
 
     try:
@@ -293,9 +389,7 @@ def iter_log_lines(filepath: Union[str, Path]) -> Iterator[str]:
                         for line in f:
                             yield line.decode("utf-8", errors="ignore").rstrip("\n\r")
         else:
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    yield line.rstrip("\n\r")
+            yield from _iter_plain_text_lines(filepath)
     except Exception as e:
         logger.error(f"Error reading file {filepath}: {e}")
         raise
@@ -355,7 +449,7 @@ def analyze_anr(log_entry: LogEntry) -> Optional[Dict[str, Any]]:
                     or extracted_data.get("process_name") is None
                 ):
                     # A more generic regex to capture the process name after "ANR in "
-                    generic_match = re.search(r"ANR in ([^ \(]+)", log_entry.message)
+                    generic_match = _ANR_PROCESS_FALLBACK.search(log_entry.message)
                     if generic_match:
                         extracted_data["process_name"] = generic_match.group(1).strip()
                     # If still not found, it remains "Unknown Process" or whatever the default was.
@@ -489,15 +583,77 @@ def analyze_memory_issue(log_entry: LogEntry) -> Optional[Dict[str, Any]]:
     return None
 
 
+# Issue analyzers applied to every parsed log entry, in order
+_ISSUE_ANALYZERS = (
+    analyze_java_crash,
+    analyze_anr,
+    analyze_native_crash_hint,
+    analyze_system_error,
+    analyze_memory_issue,
+)
+
+
+def _analyze_log_lines(
+    lines: Iterable[str], source_name: str = "<lines>"
+) -> List[Dict[str, Any]]:
+    """
+    Parses log lines into LogEntry objects and runs every issue analyzer
+    on them.
+
+    Args:
+        lines: Raw log lines, with or without line terminators.
+        source_name: Name of the log source, used in log messages.
+
+    Returns:
+        A list of dictionaries, where each dictionary represents a detected issue.
+    """
+    detected_issues: List[Dict[str, Any]] = []
+
+    logger.info(f"Analyzing log file: {source_name}")
+    line_count = 0
+    parsed_count = 0
+
+    for line_number, line_content in enumerate(lines, 1):
+        line_count += 1
+        line = line_content.strip()
+        if not line:
+            continue  # Skip empty lines
+
+        log_entry = parse_log_line(line)
+        if not log_entry:
+            logger.debug(f"Could not parse line #{line_number}: {line[:100]}...")
+            continue
+
+        parsed_count += 1
+
+        # Analyze for different types of issues
+        for analyzer in _ISSUE_ANALYZERS:
+            try:
+                result = analyzer(log_entry)
+                if result:
+                    detected_issues.append(result)
+            except Exception as e:
+                logger.error(f"Error in analyzer {analyzer.__name__}: {e}")
+
+    logger.info(
+        f"Processed {line_count} lines, parsed {parsed_count} entries, found {len(detected_issues)} issues"
+    )
+
+    return detected_issues
+
+
 def read_log_file(
-    filepath: Union[str, Path], issue_patterns_config: Optional[Dict[str, Any]] = None
+    filepath: Union[str, Path, IO],
+    issue_patterns_config: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Reads a log file line by line, parses each line into a LogEntry object,
     and then analyzes these entries for predefined issues.
 
     Args:
-        filepath: The path to the log file to be analyzed.
+        filepath: The path to the log file to be analyzed, or an open text or
+                  binary file-like object (e.g. io.BytesIO) holding the log
+                  contents, which avoids a round trip through a temporary file.
         issue_patterns_config: The configuration dictionary defining how to detect
                               various issues. If None, uses global ISSUE_PATTERNS.
 
@@ -509,66 +665,99 @@ def read_log_file(
         FileNotFoundError: If the specified file doesn't exist.
         PermissionError: If the file can't be read due to permissions.
     """
-    detected_issues: List[Dict[str, Any]] = []
-    filepath = Path(filepath)
+    if not hasattr(filepath, "read"):
+        filepath = Path(filepath)
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
 
-    if not filepath.is_file():
-        raise ValueError(f"Path is not a file: {filepath}")
+        if not filepath.is_file():
+            raise ValueError(f"Path is not a file: {filepath}")
 
     # Use provided config or default
     patterns_config = issue_patterns_config or ISSUE_PATTERNS
 
+    source_name = _source_name(filepath)
     try:
-        logger.info(f"Analyzing log file: {filepath}")
-        line_count = 0
-        parsed_count = 0
-
-        for line_number, line_content in enumerate(iter_log_lines(filepath), 1):
-            line_count += 1
-            line = line_content.strip()
-            if not line:
-                continue  # Skip empty lines
-
-            log_entry = parse_log_line(line)
-            if not log_entry:
-                logger.debug(f"Could not parse line #{line_number}: {line[:100]}...")
-                continue
+        return _analyze_log_lines(iter_log_lines(filepath), source_name)
+    except Exception as e:
+        logger.error(f"Error reading file {source_name}: {e}")
+        raise
 
-            parsed_count += 1
-
-            # Analyze for different types of issues
-            analyzers = [
-                analyze_java_crash,
-                analyze_anr,
-                analyze_native_crash_hint,
-                analyze_system_error,
-                analyze_memory_issue,
-            ]
-
-            for analyzer in analyzers:
-                try:
-                    result = analyzer(log_entry)
-                    if result:
-                        detected_issues.append(result)
-                except Exception as e:
-                    logger.error(f"Error in analyzer {analyzer.__name__}: {e}")
 
-        logger.info(
-            f"Processed {line_count} lines, parsed {parsed_count} entries, found {len(detected_issues)} issues"
-        )
+# Below this combined size, multi-file scans run inline: worker start-up
+# costs more than the regex scanning it would parallelize.
+_PARALLEL_MIN_BYTES = 256 * 1024
 
-    except Exception as e:
-        logger.error(f"Error reading file {filepath}: {e}")
-        raise
 
-    return detected_issues
+def _use_process_pool(log_files: List[Union[str, Path, IO]]) -> bool:
+    """Decide whether scanning these log sources is worth a process pool."""
+    if len(log_files) < 2 or any(hasattr(f, "read") for f in log_files):
+        return False
+    if getattr(sys, "frozen", False):
+        # Workers of a bundled executable re-run its entry point
+        return False
+    try:
+        total_size = sum(os.path.getsize(f) for f in log_files)
+    except OSError:
+        return False
+    return total_size >= _PARALLEL_MIN_BYTES
+
+
+def _map_log_files(
+    worker: Callable[..., Any],
+    log_files: List[Union[str, Path, IO]],
+    *args: Any,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[Union[str, Path, IO], Any, Optional[Exception]]]:
+    """
+    Apply worker(log_file, *args) to every log source, one file per task.
+
+    Large multi-file scans are spread over a ProcessPoolExecutor; small
+    ones and in-memory streams run inline. Results are yielded in input
+    order as (log_file, result, error) so callers keep their per-file
+    error handling. If the pool breaks, the files it did not finish are
+    scanned inline.
+    """
+    if not _use_process_pool(log_files):
+        yield from _map_log_files_inline(worker, log_files, *args)
+        return
+
+    remaining: List[Union[str, Path, IO]] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            (log_file, pool.submit(worker, log_file, *args)) for log_file in log_files
+        ]
+        for index, (log_file, future) in enumerate(futures):
+            try:
+                yield log_file, future.result(), None
+            except BrokenProcessPool as e:
+                logger.warning(f"Worker pool failed, scanning remaining files inline: {e}")
+                remaining = [f for f, _ in futures[index:]]
+                break
+            except Exception as e:
+                yield log_file, None, e
+
+    yield from _map_log_files_inline(worker, remaining, *args)
+
+
+def _map_log_files_inline(
+    worker: Callable[..., Any],
+    log_files: List[Union[str, Path, IO]],
+    *args: Any,
+) -> Iterator[Tuple[Union[str, Path, IO], Any, Optional[Exception]]]:
+    """Apply worker(log_file, *args) to every log source in this process."""
+    for log_file in log_files:
+        try:
+            yield log_file, worker(log_file, *args), None
+        except Exception as e:
+            yield log_file, None, e
 
 
 def read_logs_from_directory(
-    directory: Union[str, Path], issue_patterns_config: Optional[Dict[str, Any]] = None
+    directory: Union[str, Path],
+    issue_patterns_config: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Recursively read all log files within the specified directory.
@@ -576,6 +765,8 @@ def read_logs_from_directory(
     Args:
         directory: Path to the directory containing log files.
         issue_patterns_config: Configuration for issue detection patterns.
+        max_workers: Worker processes used when the files are large enough
+                     to be scanned in parallel (defaults to the CPU count).
 
     Returns:
         List of detected issues from all log files.
@@ -598,15 +789,20 @@ def read_logs_from_directory(
     logger.info(f"Scanning directory: {directory}")
 
     try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                logger.debug(f"Processing file: {file_path}")
-                try:
-                    issues = read_log_file(file_path, issue_patterns_config)
-                    all_issues.extend(issues)
-                except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {e}")
-                    continue
+        log_files = [
+            file_path
+            for file_path in directory.rglob("*")
+            if file_path.is_file() and file_path.suffix.lower() in supported_extensions
+        ]
+
+        for file_path, issues, error in _map_log_files(
+            read_log_file, log_files, issue_patterns_config, max_workers=max_workers
+        ):
+            if error is not None:
+                logger.error(f"Error processing file {file_path}: {error}")
+                continue
+            logger.debug(f"Processed file: {file_path}")
+            all_issues.extend(issues)
 
         logger.info(f"Found {len(all_issues)} total issues in directory")
 
@@ -679,7 +875,7 @@ def save_report_to_json(
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+            f.write(dumps_json(report_data, indent=True))
 
         logger.info(f"Report saved to: {output_path}")
 
@@ -839,14 +1035,14 @@ def main(argv: Optional[List[str]] = None) -> None:
 
 
 def smart_search_logs(
-    query: str, log_files: List[Union[str, Path]], max_results: int = 50
+    query: str, log_files: List[Union[str, Path, IO]], max_results: int = 50
 ) -> List[Dict[str, Any]]:
     """
     Perform intelligent search across multiple log files
 
     Args:
         query: Natural language or keyword search query
-        log_files: List of log file paths to search
+        log_files: List of log file paths (or open file-like objects) to search
         max_results: Maximum number of results to return
 
     Returns:
@@ -856,70 +1052,137 @@ def smart_search_logs(
         logger.warning("Intelligent features not available. Using basic search.")
         return basic_search_logs(query, log_files, max_results)
 
-    search_engine = SmartSearchEngine()
-    all_results = []
+    return smart_search_logs_multi([query], log_files, max_results)[query]
 
-    for log_file in log_files:
-        try:
-            # Read log lines
-            log_lines = []
-            for line in iter_log_lines(log_file):
-                log_lines.append(line)
-
-            # Perform smart search
-            results = search_engine.smart_search(query, log_lines, max_results)
-
-            # Add file information to results
-            for result in results:
-                result_dict = {
-                    "file": str(log_file),
-                    "line_number": result.line_number,
-                    "content": result.content,
-                    "relevance_score": result.relevance_score,
-                    "match_type": result.match_type.value,
-                    "highlights": result.highlights,
-                }
-                all_results.append(result_dict)
 
-        except Exception as e:
-            logger.error(f"Error searching in {log_file}: {e}")
+def _search_log_file(
+    log_file: Union[str, Path, IO], queries: List[str], max_results: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Search a single log source for several queries."""
+    log_lines = list(iter_log_lines(log_file))
+    results = _get_search_engine().multi_search(queries, log_lines, max_results)
+
+    # Add file information to results
+    return {
+        query: [
+            {
+                "file": _source_name(log_file),
+                "line_number": result.line_number,
+                "content": result.content,
+                "relevance_score": result.relevance_score,
+                "match_type": result.match_type.value,
+                "highlights": result.highlights,
+            }
+            for result in query_results
+        ]
+        for query, query_results in results.items()
+    }
+
+
+def smart_search_logs_multi(
+    queries: List[str],
+    log_files: List[Union[str, Path, IO]],
+    max_results: int = 50,
+    max_workers: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Perform intelligent search for several queries across multiple log files
+
+    Each log file is read and scanned once for all queries, instead of once
+    per query as with repeated smart_search_logs calls.
+
+    Args:
+        queries: Natural language or keyword search queries
+        log_files: List of log file paths (or open file-like objects) to search
+        max_results: Maximum number of results to return per query
+        max_workers: Worker processes used when the files are large enough
+                     to be searched in parallel (defaults to the CPU count)
+
+    Returns:
+        Mapping of each query to its search results with relevance scoring
+    """
+    if not INTELLIGENT_FEATURES_AVAILABLE:
+        logger.warning("Intelligent features not available. Using basic search.")
+        return basic_search_logs_multi(queries, log_files, max_results)
+
+    all_results = {query: [] for query in queries}
+
+    for log_file, results, error in _map_log_files(
+        _search_log_file, log_files, queries, max_results, max_workers=max_workers
+    ):
+        if error is not None:
+            logger.error(f"Error searching in {log_file}: {error}")
+            continue
+        for query, query_results in results.items():
+            all_results[query].extend(query_results)
 
     # Sort by relevance score
-    all_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-    return all_results[:max_results]
+    for query_results in all_results.values():
+        query_results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        del query_results[max_results:]
+    return all_results
 
 
 def basic_search_logs(
-    query: str, log_files: List[Union[str, Path]], max_results: int = 50
+    query: str, log_files: List[Union[str, Path, IO]], max_results: int = 50
 ) -> List[Dict[str, Any]]:
     """
     Basic search functionality when intelligent features are not available
     """
-    results = []
-    query_lower = query.lower()
+    return basic_search_logs_multi([query], log_files, max_results)[query]
+
+
+def basic_search_logs_multi(
+    queries: List[str], log_files: List[Union[str, Path, IO]], max_results: int = 50
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Basic search for several queries when intelligent features are not available
+
+    Each log source is streamed once for all queries, so open file-like
+    objects are searched for every query rather than only the first. A query
+    stops matching once it has max_results results across all sources.
+    """
+    all_results: Dict[str, List[Dict[str, Any]]] = {query: [] for query in queries}
+    open_queries = [
+        (query.lower(), results)
+        for query, results in all_results.items()
+        if len(results) < max_results
+    ]
 
     for log_file in log_files:
+        if not open_queries:
+            break
+        file_name = _source_name(log_file)
         try:
             for line_number, line in enumerate(iter_log_lines(log_file), 1):
-                if query_lower in line.lower():
-                    results.append(
-                        {
-                            "file": str(log_file),
-                            "line_number": line_number,
-                            "content": line,
-                            "relevance_score": 1.0,
-                            "match_type": "basic",
-                            "highlights": [],
-                        }
-                    )
-
-                    if len(results) >= max_results:
+                line_lower = line.lower()
+                filled = False
+                for query_lower, results in open_queries:
+                    if query_lower in line_lower:
+                        results.append(
+                            {
+                                "file": file_name,
+                                "line_number": line_number,
+                                "content": line,
+                                "relevance_score": 1.0,
+                                "match_type": "basic",
+                                "highlights": [],
+                            }
+                        )
+                        filled = filled or len(results) >= max_results
+
+                if filled:
+                    open_queries = [
+                        (query_lower, results)
+                        for query_lower, results in open_queries
+                        if len(results) < max_results
+                    ]
+                    if not open_queries:
                         break
-
         except Exception as e:
-            logger.error(f"Error searching in {log_file}: {e}")
+            logger.error(f"Error searching in {file_name}: {e}")
 
-    return results
+    return all_results
 
 
 def prioritize_issues(
@@ -941,7 +1204,7 @@ def prioritize_issues(
         )
         return basic_prioritize_issues(issues)
 
-    scorer = IssuePriorityScorer()
+    scorer = _get_priority_scorer()
 
     # Create context object
     issue_context = None
@@ -953,26 +1216,22 @@ def prioritize_issues(
         )
 
     prioritized_issues = []
+    scorable_issues = []
+    scorable_data = []
 
     for issue in issues:
         try:
             # Convert issue to format expected by priority scorer
-            issue_data = {
-                "type": issue.get("type", "unknown").lower(),
-                "severity": _determine_severity(issue),
-                "frequency": 1,  # Default frequency, could be enhanced
-                "component": _determine_component(issue),
-                "message": _get_issue_message(issue),
-            }
-
-            # Calculate priority
-            priority_info = scorer.calculate_priority(issue_data, issue_context)
-
-            # Add priority information to original issue
-            enhanced_issue = {**issue}
-            enhanced_issue.update(priority_info)
-
-            prioritized_issues.append(enhanced_issue)
+            scorable_data.append(
+                {
+                    "type": issue.get("type", "unknown").lower(),
+                    "severity": _determine_severity(issue),
+                    "frequency": 1,  # Default frequency, could be enhanced
+                    "component": _determine_component(issue),
+                    "message": _get_issue_message(issue),
+                }
+            )
+            scorable_issues.append(issue)
 
         except Exception as e:
             logger.error(f"Error prioritizing issue: {e}")
@@ -980,6 +1239,26 @@ def prioritize_issues(
                 issue
             )  # Add original issue if prioritization fails
 
+    # Calculate priorities for all convertible issues in one batch and
+    # add the priority information to the original issues
+    try:
+        priority_infos = scorer.score_issues(scorable_data, issue_context)
+    except Exception as e:
+        # Score one issue at a time instead, so an issue the scorer rejects
+        # is kept unscored rather than failing the whole batch
+        logger.error(f"Error prioritizing issues as a batch: {e}")
+        priority_infos = []
+        for issue_data in scorable_data:
+            try:
+                priority_infos.append(scorer.calculate_priority(issue_data, issue_context))
+            except Exception as e:
+                logger.error(f"Error prioritizing issue: {e}")
+                priority_infos.append({})  # Add original issue if prioritization fails
+    prioritized_issues.extend(
+        {**issue, **priority_info}
+        for issue, priority_info in zip(scorable_issues, priority_infos)
+    )
+
     # Sort by priority score
     prioritized_issues.sort(key=lambda x: x.get("total_score", 0), reverse=True)
 
@@ -1048,6 +1327,10 @@ def _get_issue_message(issue: Dict[str, Any]) -> str:
     return issue.get("type", "Unknown issue")
 
 
+# Keywords marking a line as a crash candidate for ML classification
+_CRASH_KEYWORD_RE = re.compile(r"exception|fatal|crash|abort", re.IGNORECASE)
+
+
 def analyze_with_ml(log_lines: List[str]) -> Dict[str, Any]:
     """
     Perform ML-enhanced analysis on log lines
@@ -1064,7 +1347,7 @@ def analyze_with_ml(log_lines: List[str]) -> Dict[str, Any]:
 
     try:
         # Create ML analyzer
-        ml_analyzer = create_ml_analyzer()
+        ml_analyzer = _get_ml_analyzer()
 
         results = {
             "ml_available": True,
@@ -1078,18 +1361,13 @@ def analyze_with_ml(log_lines: List[str]) -> Dict[str, Any]:
         if "crash_classifier" in ml_analyzer:
             classifier = ml_analyzer["crash_classifier"]
 
-            # Find potential crash lines
-            crash_lines = [
-                line
-                for line in log_lines
-                if any(
-                    keyword in line.lower()
-                    for keyword in ["exception", "fatal", "crash", "abort"]
-                )
-            ]
+            # Find potential crash lines, stopping at the first 10 crashes
+            crash_lines = list(
+                islice(filter(_CRASH_KEYWORD_RE.search, log_lines), 10)
+            )
+            predictions = classifier.batch_classify(crash_lines)
 
-            for crash_line in crash_lines[:10]:  # Limit to first 10 crashes
-                prediction = classifier.classify_crash(crash_line)
+            for crash_line, prediction in zip(crash_lines, predictions):
                 results["crash_classifications"].append(
                     {
                         "line": crash_line,
@@ -1229,31 +1507,30 @@ def _generate_ml_insights(ml_results: Dict[str, Any]) -> Dict[str, Any]:
     return insights
 
 
-def get_ml_enhanced_report(log_file_path: Union[str, Path]) -> Dict[str, Any]:
+def get_ml_enhanced_report(log_file_path: Union[str, Path, IO]) -> Dict[str, Any]:
     """
     Generate ML-enhanced analysis report for a log file
 
     Args:
-        log_file_path: Path to log file
+        log_file_path: Path to log file, or an open file-like object
 
     Returns:
         Enhanced analysis report with ML insights
     """
     try:
-        # Read log file
-        log_lines = []
-        for line in iter_log_lines(log_file_path):
-            log_lines.append(line)
+        # Read log file once and reuse the lines for both analyses
+        source_name = _source_name(log_file_path)
+        log_lines = list(iter_log_lines(log_file_path))
 
         # Perform standard analysis
-        standard_issues = read_log_file(log_file_path)
+        standard_issues = _analyze_log_lines(log_lines, source_name)
 
         # Perform ML analysis
         ml_results = analyze_with_ml(log_lines)
 
         # Combine results
         enhanced_report = {
-            "file_path": str(log_file_path),
+            "file_path": source_name,
             "total_lines": len(log_lines),
             "standard_analysis": {
                 "issues": standard_issues,
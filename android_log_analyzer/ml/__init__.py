@@ -8,6 +8,11 @@ This module provides AI/ML capabilities for intelligent log analysis including:
 - Advanced feature extraction and modeling
 """
 
+import functools
+import logging
+import os
+import time
+
 # Import models with fallback handling
 try:
     from .models.crash_classifier import CrashClassifier, CrashPrediction
@@ -30,6 +35,8 @@ try:
 except ImportError:
     PATTERN_RECOGNIZER_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 __version__ = "0.2.0"
 __author__ = "Android Log Analyzer ML Team"
 
@@ -62,6 +69,31 @@ __all__ = [
 ]
 
 
+def _ttl_cache(seconds):
+    """
+    Cache a zero-argument function's result for ``seconds``
+
+    The wrapped function accepts ``force_refresh=True`` to bypass the cache.
+    Cached results are shared between callers and should be treated as
+    read-only.
+    """
+
+    def decorator(func):
+        entry = None  # (value, expires_at)
+
+        @functools.wraps(func)
+        def wrapper(force_refresh=False):
+            nonlocal entry
+            now = time.monotonic()
+            if force_refresh or entry is None or now >= entry[1]:
+                entry = (func(), now + seconds)
+            return entry[0]
+
+        return wrapper
+
+    return decorator
+
+
 def create_ml_analyzer():
     """
     Create a complete ML analyzer with all available models
@@ -80,13 +112,47 @@ def create_ml_analyzer():
     if PATTERN_RECOGNIZER_AVAILABLE:
         analyzer["pattern_recognizer"] = PatternRecognizer()
 
+    if not os.environ.get("ALA_SKIP_WARMUP"):
+        _warm_up(analyzer)
+
     return analyzer
 
 
+_WARMUP_LOGS = [
+    "01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:00.124  1234  1234 E AndroidRuntime: java.lang.NullPointerException",
+]
+
+
+def _warm_up(analyzer):
+    """
+    Run a small dummy workload through freshly created models
+
+    The first call into each model pays one-off costs (lazy sklearn imports
+    and input validation setup, pattern compilation), so pay them here
+    instead of on the first real analysis. Set ALA_SKIP_WARMUP to skip.
+    """
+    try:
+        classifier = analyzer.get("crash_classifier")
+        if classifier is not None:
+            classifier.batch_classify(_WARMUP_LOGS)
+            # Don't leave the dummy predictions in the cache or its stats
+            classifier.clear_cache()
+
+        recognizer = analyzer.get("pattern_recognizer")
+        if recognizer is not None:
+            recognizer.recognize_patterns(_WARMUP_LOGS)
+    except Exception as e:
+        logger.debug(f"ML warmup failed: {e}")
+
+
+@_ttl_cache(60)
 def get_ml_capabilities():
     """
     Get information about available ML capabilities
 
+    Results are cached for 60 seconds; pass ``force_refresh=True`` to rebuild.
+
     Returns:
         Dictionary with ML feature availability and descriptions
     """
@@ -161,10 +227,14 @@ numpy>=1.20.0
     }
 
 
+@_ttl_cache(60)
 def check_ml_health():
     """
     Check the health and status of ML components
 
+    Instantiating every model is expensive, so results are cached for
+    60 seconds; pass ``force_refresh=True`` to re-run the checks.
+
     Returns:
         Health check results
     """
@@ -25,6 +25,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Android log pattern: MM-DD HH:MM:SS.mmm PID TID LEVEL TAG: MESSAGE
+_LOG_LINE_RE = re.compile(
+    r"(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})\.(\d{3})"
+    r"\s+\d+\s+\d+\s+([VDIWEF])\s+([^:]+):\s*(.*)"
+)
+_ERROR_RE = re.compile(r"(error|exception|fail)", re.IGNORECASE)
+_WARNING_RE = re.compile(r"(warn|slow|timeout)", re.IGNORECASE)
+
 
 @dataclass
 class AnomalyResult:
@@ -116,7 +124,7 @@ class AnomalyDetector:
             Feature matrix for anomaly detection
         """
         if not log_lines:
-            return np.array([])
+            return np.array([], dtype=np.float32)
 
         # Parse log lines and extract metrics
         metrics = self._parse_log_metrics(log_lines)
@@ -124,39 +132,45 @@ class AnomalyDetector:
         # Aggregate metrics by time windows
         windowed_metrics = self._aggregate_by_time_window(metrics, time_window)
 
-        # Convert to feature matrix
+        # Convert to feature matrix; float32 is what IsolationForest works in
+        # internally, so this avoids a float64 copy and halves memory traffic
         features = self._metrics_to_features(windowed_metrics)
 
-        return np.array(features)
+        return np.array(features, dtype=np.float32)
 
     def _parse_log_metrics(self, log_lines: List[str]) -> List[LogMetrics]:
         """Parse log lines and extract metrics"""
         metrics = []
+        match_line = _LOG_LINE_RE.match
+        count_errors = _ERROR_RE.findall
+        count_warnings = _WARNING_RE.findall
 
-        # Android log pattern: MM-DD HH:MM:SS.mmm PID TID LEVEL TAG: MESSAGE
-        log_pattern = r"(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+\d+\s+\d+\s+([VDIWEF])\s+([^:]+):\s*(.*)"
+        # Timestamps carry no year; assume the current one
+        current_year = datetime.now().year
 
         for line in log_lines:
-            match = re.match(log_pattern, line)
+            match = match_line(line)
             if match:
-                timestamp_str, level, tag, message = match.groups()
+                month, day, hour, minute, second, millis, level, tag, message = (
+                    match.groups()
+                )
 
                 try:
-                    # Parse timestamp (assuming current year)
-                    current_year = datetime.now().year
-                    timestamp = datetime.strptime(
-                        f"{current_year}-{timestamp_str}", "%Y-%m-%d %H:%M:%S.%f"
+                    timestamp = datetime(
+                        current_year,
+                        int(month),
+                        int(day),
+                        int(hour),
+                        int(minute),
+                        int(second),
+                        int(millis) * 1000,
                     )
                 except ValueError:
                     timestamp = datetime.now()
 
                 # Count error indicators
-                error_count = len(
-                    re.findall(r"(error|exception|fail)", message, re.IGNORECASE)
-                )
-                warning_count = len(
-                    re.findall(r"(warn|slow|timeout)", message, re.IGNORECASE)
-                )
+                error_count = len(count_errors(message))
+                warning_count = len(count_warnings(message))
 
                 metrics.append(
                     LogMetrics(
@@ -210,9 +224,8 @@ class AnomalyDetector:
                 "warning_logs": level_counts.get("W", 0),
                 "info_logs": level_counts.get("I", 0),
                 "debug_logs": level_counts.get("D", 0),
-                "avg_message_length": np.mean(
-                    [m.message_length for m in window_metrics]
-                ),
+                "avg_message_length": sum(m.message_length for m in window_metrics)
+                / len(window_metrics),
                 "total_errors": sum(m.error_count for m in window_metrics),
                 "total_warnings": sum(m.warning_count for m in window_metrics),
                 "unique_tags": len(tag_counts),
@@ -307,26 +320,36 @@ class AnomalyDetector:
         """
         results = []
 
+        # Parse and window the lines once for both rule-based and ML detection
+        windowed_metrics = self._aggregate_by_time_window(
+            self._parse_log_metrics(log_lines), 60
+        )  # 1-minute windows
+
         # Rule-based anomaly detection (always available)
-        rule_based_results = self._rule_based_detection(log_lines)
+        rule_based_results = self._rule_based_detection(log_lines, windowed_metrics)
         results.extend(rule_based_results)
 
         # ML-based detection if available and trained
         if ML_AVAILABLE and self.is_trained:
-            ml_results = self._ml_based_detection(log_lines)
+            ml_results = self._ml_based_detection(log_lines, windowed_metrics)
             results.extend(ml_results)
 
         return results
 
-    def _rule_based_detection(self, log_lines: List[str]) -> List[AnomalyResult]:
+    def _rule_based_detection(
+        self,
+        log_lines: List[str],
+        windowed_metrics: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[AnomalyResult]:
         """Rule-based anomaly detection"""
         results = []
 
         # Analyze patterns over time windows
-        metrics = self._parse_log_metrics(log_lines)
-        windowed_metrics = self._aggregate_by_time_window(
-            metrics, 60
-        )  # 1-minute windows
+        if windowed_metrics is None:
+            metrics = self._parse_log_metrics(log_lines)
+            windowed_metrics = self._aggregate_by_time_window(
+                metrics, 60
+            )  # 1-minute windows
 
         for window in windowed_metrics:
             # Check for high error rate
@@ -374,25 +397,31 @@ class AnomalyDetector:
         """Pattern-based anomaly detection"""
         results = []
 
+        # Count occurrences of every pattern in a single pass over the lines
+        searches = [
+            (name, re.compile(config["pattern"], re.IGNORECASE).search)
+            for name, config in self.anomaly_patterns.items()
+        ]
+        match_counts = dict.fromkeys(self.anomaly_patterns, 0)
+
+        for line in log_lines:
+            for pattern_name, search in searches:
+                if search(line):
+                    match_counts[pattern_name] += 1
+
         for pattern_name, pattern_config in self.anomaly_patterns.items():
-            pattern = pattern_config["pattern"]
             threshold = pattern_config["threshold"]
             severity = pattern_config["severity"]
-
-            # Count pattern occurrences
-            matches = []
-            for line in log_lines:
-                if re.search(pattern, line, re.IGNORECASE):
-                    matches.append(line)
+            match_count = match_counts[pattern_name]
 
             # Check if threshold exceeded
-            if len(matches) > threshold:
+            if match_count > threshold:
                 results.append(
                     AnomalyResult(
                         is_anomaly=True,
-                        anomaly_score=len(matches) / threshold,
+                        anomaly_score=match_count / threshold,
                         anomaly_type=pattern_name,
-                        description=f'Pattern "{pattern_name}" detected {len(matches)} times (threshold: {threshold})',
+                        description=f'Pattern "{pattern_name}" detected {match_count} times (threshold: {threshold})',
                         severity=severity,
                         recommendations=self._get_pattern_recommendations(pattern_name),
                     )
@@ -400,13 +429,22 @@ class AnomalyDetector:
 
         return results
 
-    def _ml_based_detection(self, log_lines: List[str]) -> List[AnomalyResult]:
+    def _ml_based_detection(
+        self,
+        log_lines: List[str],
+        windowed_metrics: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[AnomalyResult]:
         """ML-based anomaly detection"""
         results = []
 
         try:
-            # Extract features
-            features = self.extract_features(log_lines)
+            # Extract features, reusing already windowed metrics if given
+            if windowed_metrics is None:
+                features = self.extract_features(log_lines)
+            else:
+                features = np.array(
+                    self._metrics_to_features(windowed_metrics), dtype=np.float32
+                )
 
             if len(features) == 0:
                 return results
@@ -414,27 +452,28 @@ class AnomalyDetector:
             # Normalize features
             features_scaled = self.scaler.transform(features)
 
-            # Predict anomalies
-            predictions = self.isolation_forest.predict(features_scaled)
+            # Score all windows at once; predict() is decision_function() < 0,
+            # so one forest traversal yields both the labels and the scores
             scores = self.isolation_forest.decision_function(features_scaled)
+            anomaly_indices = np.flatnonzero(scores < 0)
+            anomaly_scores = np.abs(scores[anomaly_indices])
 
-            # Process results
-            for i, (prediction, score) in enumerate(zip(predictions, scores)):
-                if prediction == -1:  # Anomaly detected
-                    results.append(
-                        AnomalyResult(
-                            is_anomaly=True,
-                            anomaly_score=abs(score),
-                            anomaly_type="ml_detected_anomaly",
-                            description=f"ML model detected anomaly in time window {i+1}",
-                            severity=self._score_to_severity(abs(score)),
-                            recommendations=[
-                                "Review logs in this time period",
-                                "Check for unusual system behavior",
-                                "Correlate with external events",
-                            ],
-                        )
+            # Process results only for the windows flagged as anomalies
+            for i, score in zip(anomaly_indices.tolist(), anomaly_scores.tolist()):
+                results.append(
+                    AnomalyResult(
+                        is_anomaly=True,
+                        anomaly_score=score,
+                        anomaly_type="ml_detected_anomaly",
+                        description=f"ML model detected anomaly in time window {i+1}",
+                        severity=self._score_to_severity(score),
+                        recommendations=[
+                            "Review logs in this time period",
+                            "Check for unusual system behavior",
+                            "Correlate with external events",
+                        ],
                     )
+                )
 
         except Exception as e:
             logger.error(f"ML-based anomaly detection failed: {e}")
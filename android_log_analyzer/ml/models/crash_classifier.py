@@ -10,6 +10,7 @@ import logging
 import pickle
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
 from pathlib import Path
 
 # Try to import ML libraries with fallbacks
@@ -42,10 +43,16 @@ class CrashPrediction:
 class CrashClassifier:
     """Machine learning-based crash classifier"""
 
+    # Maximum number of exact-match predictions kept in the LRU cache
+    CACHE_SIZE = 10_000
+
     def __init__(self, model_path: Optional[Path] = None):
         self.model_path = model_path
         self.pipeline = None
         self.is_trained = False
+        self._prediction_cache: "OrderedDict[str, CrashPrediction]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
         # Crash type patterns for feature extraction
         self.crash_patterns = {
@@ -116,6 +123,7 @@ class CrashClassifier:
                         ngram_range=(1, 2),
                         stop_words="english",
                         lowercase=True,
+                        dtype=np.float32,
                     ),
                 ),
                 ("classifier", MultinomialNB(alpha=0.1)),
@@ -135,6 +143,7 @@ class CrashClassifier:
             with open(self.model_path, "rb") as f:
                 self.pipeline = pickle.load(f)
             self.is_trained = True
+            self.clear_cache()
             logger.info(f"Loaded pre-trained crash classifier from {self.model_path}")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
@@ -171,6 +180,7 @@ class CrashClassifier:
             # Train the model
             self.pipeline.fit(texts, labels)
             self.is_trained = True
+            self.clear_cache()
 
             # Save the model
             self._save_model()
@@ -241,19 +251,58 @@ class CrashClassifier:
 
         Returns:
             CrashPrediction with classification results
+
+        Identical log texts (e.g. repeated stack trace headers) are served
+        from an LRU cache; the returned prediction is shared between calls
+        and should be treated as read-only.
         """
+        # Surrounding whitespace never affects classification, so texts
+        # that differ only in it share a cache entry
+        key = log_text.strip()
+        cache = self._prediction_cache
+        prediction = cache.get(key)
+        if prediction is not None:
+            self._cache_hits += 1
+            cache.move_to_end(key)
+            return prediction
+
+        self._cache_misses += 1
         if ML_AVAILABLE and self.is_trained:
-            return self._ml_classify(log_text)
+            prediction = self._ml_classify(key)
         else:
-            return self._rule_based_classify(log_text)
+            prediction = self._rule_based_classify(key)
+
+        cache[key] = prediction
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return prediction
+
+    def clear_cache(self):
+        """Drop all cached predictions and reset the hit statistics"""
+        self._prediction_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def _ml_classify(self, log_text: str) -> CrashPrediction:
         """Machine learning-based classification"""
         try:
-            # Predict crash type
-            prediction = self.pipeline.predict([log_text])[0]
-            probabilities = self.pipeline.predict_proba([log_text])[0]
-            confidence = max(probabilities)
+            return self._ml_classify_many([log_text])[0]
+
+        except Exception as e:
+            logger.error(f"ML classification failed: {e}")
+            return self._rule_based_classify(log_text)
+
+    def _ml_classify_many(self, log_texts: List[str]) -> List[CrashPrediction]:
+        """Classify several texts with a single vectorize/predict_proba call"""
+        # predict() is argmax over predict_proba(), so one call yields both
+        probabilities = self.pipeline.predict_proba(log_texts)
+        classes = self.pipeline.classes_
+        predictions = []
+
+        for log_text, row in zip(log_texts, probabilities):
+            best = int(row.argmax())
+            prediction = classes[best]
+            confidence = row[best]
 
             # Determine severity
             severity = self._determine_severity(log_text, prediction)
@@ -262,17 +311,17 @@ class CrashClassifier:
             description = self._generate_description(prediction, confidence)
             recommendations = self._generate_recommendations(prediction)
 
-            return CrashPrediction(
-                crash_type=prediction,
-                confidence=confidence,
-                severity=severity,
-                description=description,
-                recommendations=recommendations,
+            predictions.append(
+                CrashPrediction(
+                    crash_type=prediction,
+                    confidence=confidence,
+                    severity=severity,
+                    description=description,
+                    recommendations=recommendations,
+                )
             )
 
-        except Exception as e:
-            logger.error(f"ML classification failed: {e}")
-            return self._rule_based_classify(log_text)
+        return predictions
 
     def _rule_based_classify(self, log_text: str) -> CrashPrediction:
         """Rule-based classification fallback"""
@@ -370,8 +419,52 @@ class CrashClassifier:
         return recommendations_map.get(crash_type, ["Investigate crash cause manually"])
 
     def batch_classify(self, log_texts: List[str]) -> List[CrashPrediction]:
-        """Classify multiple crashes in batch"""
-        return [self.classify_crash(text) for text in log_texts]
+        """
+        Classify multiple crashes in batch
+
+        Cached texts are answered directly; the remaining distinct texts go
+        through the ML pipeline in one vectorized call.
+
+        Args:
+            log_texts: Log texts containing crash information
+
+        Returns:
+            CrashPrediction for each input text, in the same order
+        """
+        if not (ML_AVAILABLE and self.is_trained):
+            return [self.classify_crash(text) for text in log_texts]
+
+        keys = [text.strip() for text in log_texts]
+        cache = self._prediction_cache
+        misses = list(dict.fromkeys(k for k in keys if k not in cache))
+        self._cache_misses += len(misses)
+        self._cache_hits += len(keys) - len(misses)
+
+        if misses:
+            try:
+                fresh = self._ml_classify_many(misses)
+            except Exception as e:
+                logger.error(f"ML batch classification failed: {e}")
+                fresh = [self._rule_based_classify(text) for text in misses]
+
+            results = dict(zip(misses, fresh))
+        else:
+            results = {}
+
+        predictions = []
+        for key in keys:
+            prediction = results.get(key)
+            if prediction is None:
+                prediction = cache[key]
+                cache.move_to_end(key)
+            predictions.append(prediction)
+
+        for key, prediction in results.items():
+            cache[key] = prediction
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return predictions
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
@@ -381,4 +474,7 @@ class CrashClassifier:
             "model_type": "Naive Bayes with TF-IDF" if ML_AVAILABLE else "Rule-based",
             "supported_types": list(self.crash_patterns.keys()),
             "model_path": str(self.model_path) if self.model_path else None,
+            "cached_predictions": len(self._prediction_cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
         }
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta
 import hashlib
+from functools import lru_cache
 
 # Try to import ML libraries
 try:
@@ -27,6 +28,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Log line fragments, compiled once at import instead of on every line
+_MESSAGE_RE = re.compile(r"[VDIWEF]\s+[^:]+:\s*(.*)")
+_LEVEL_TAG_RE = re.compile(r"([VDIWEF])\s+([^:]+):")
+_WORD_RE = re.compile(r"\w+")
+
+# Message normalization rules, applied in order
+_NORMALIZE_RULES = (
+    (re.compile(r"\b\d+\b"), "<NUM>"),  # numbers
+    (re.compile(r"0x[0-9a-fA-F]+"), "<ADDR>"),  # hex addresses
+    (re.compile(r"/[^\s]+"), "<PATH>"),  # file paths
+    (re.compile(r"\d{2}:\d{2}:\d{2}"), "<TIME>"),  # timestamps
+    (re.compile(r"com\.[a-zA-Z0-9.]+"), "<PACKAGE>"),  # package names
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_template(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a template's patterns into one case-insensitive alternation"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
 
 @dataclass
 class Pattern:
@@ -120,7 +141,11 @@ class PatternRecognizer:
         """Initialize machine learning components"""
         # TF-IDF vectorizer for text similarity
         self.vectorizer = TfidfVectorizer(
-            max_features=500, ngram_range=(1, 3), stop_words="english", lowercase=True
+            max_features=500,
+            ngram_range=(1, 3),
+            stop_words="english",
+            lowercase=True,
+            dtype=np.float32,
         )
 
         # DBSCAN for clustering similar patterns
@@ -140,17 +165,22 @@ class PatternRecognizer:
         """
         patterns = []
 
+        # Extract and normalize messages once for frequency and ML recognition
+        message_groups = self._group_messages(log_lines)
+
         # Template-based pattern recognition
         template_patterns = self._recognize_template_patterns(log_lines)
         patterns.extend(template_patterns)
 
         # Frequency-based pattern recognition
-        frequency_patterns = self._recognize_frequency_patterns(log_lines)
+        frequency_patterns = self._recognize_frequency_patterns(
+            log_lines, message_groups
+        )
         patterns.extend(frequency_patterns)
 
         # ML-based pattern recognition
         if ML_AVAILABLE:
-            ml_patterns = self._recognize_ml_patterns(log_lines)
+            ml_patterns = self._recognize_ml_patterns(log_lines, message_groups)
             patterns.extend(ml_patterns)
 
         # Sequence pattern recognition
@@ -167,14 +197,8 @@ class PatternRecognizer:
         patterns = []
 
         for template_name, template_config in self.pattern_templates.items():
-            template_patterns = template_config["patterns"]
-            matches = []
-
-            for line in log_lines:
-                for pattern in template_patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        matches.append(line)
-                        break
+            search = _compile_template(tuple(template_config["patterns"])).search
+            matches = [line for line in log_lines if search(line)]
 
             if matches:
                 pattern_id = self._generate_pattern_id(template_name, matches)
@@ -198,31 +222,24 @@ class PatternRecognizer:
 
         return patterns
 
-    def _recognize_frequency_patterns(self, log_lines: List[str]) -> List[Pattern]:
+    def _recognize_frequency_patterns(
+        self,
+        log_lines: List[str],
+        message_groups: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Pattern]:
         """Recognize patterns based on frequency analysis"""
         patterns = []
 
-        # Extract log messages (remove timestamps, PIDs, etc.)
-        messages = []
-        for line in log_lines:
-            # Extract message part after tag
-            match = re.search(r"[VDIWEF]\s+[^:]+:\s*(.*)", line)
-            if match:
-                message = match.group(1)
-                # Normalize message (replace numbers and specific values)
-                normalized = self._normalize_message(message)
-                messages.append((normalized, line))
-
-        # Count message frequencies
-        message_counts = Counter(msg[0] for msg in messages)
+        # Group original lines by normalized message
+        if message_groups is None:
+            message_groups = self._group_messages(log_lines)
 
         # Identify frequent patterns (appearing more than threshold)
         threshold = max(3, len(log_lines) // 100)  # At least 3 or 1% of logs
 
-        for normalized_msg, count in message_counts.items():
+        for normalized_msg, examples in message_groups.items():
+            count = len(examples)
             if count >= threshold:
-                # Get original examples
-                examples = [msg[1] for msg in messages if msg[0] == normalized_msg]
 
                 pattern_id = self._generate_pattern_id("frequency", [normalized_msg])
 
@@ -245,7 +262,11 @@ class PatternRecognizer:
 
         return patterns
 
-    def _recognize_ml_patterns(self, log_lines: List[str]) -> List[Pattern]:
+    def _recognize_ml_patterns(
+        self,
+        log_lines: List[str],
+        message_groups: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Pattern]:
         """Recognize patterns using machine learning clustering"""
         patterns = []
 
@@ -253,33 +274,35 @@ class PatternRecognizer:
             return patterns
 
         try:
-            # Extract and normalize messages
-            messages = []
-            original_lines = []
-
-            for line in log_lines:
-                match = re.search(r"[VDIWEF]\s+[^:]+:\s*(.*)", line)
-                if match:
-                    message = match.group(1)
-                    normalized = self._normalize_message(message)
-                    if len(normalized) > 10:  # Filter out very short messages
-                        messages.append(normalized)
-                        original_lines.append(line)
-
-            if len(messages) < 5:
+            # Extract and normalize messages, filtering out very short ones
+            if message_groups is None:
+                message_groups = self._group_messages(log_lines)
+            message_groups = {
+                message: lines
+                for message, lines in message_groups.items()
+                if len(message) > 10
+            }
+
+            if sum(len(lines) for lines in message_groups.values()) < 5:
                 return patterns
 
-            # Vectorize messages
+            # Vectorize each distinct message once, keeping the sparse matrix
+            messages = list(message_groups)
             tfidf_matrix = self.vectorizer.fit_transform(messages)
 
-            # Cluster similar messages
-            clusters = self.clusterer.fit_predict(tfidf_matrix.toarray())
+            # Cluster similar messages, weighting each by its occurrence count
+            clusters = self.clusterer.fit_predict(
+                tfidf_matrix,
+                sample_weight=[len(message_groups[m]) for m in messages],
+            )
 
             # Process clusters
             cluster_groups = defaultdict(list)
-            for i, cluster_id in enumerate(clusters):
+            for message, cluster_id in zip(messages, clusters):
                 if cluster_id != -1:  # Ignore noise points
-                    cluster_groups[cluster_id].append((messages[i], original_lines[i]))
+                    cluster_groups[cluster_id].extend(
+                        (message, line) for line in message_groups[message]
+                    )
 
             # Create patterns from clusters
             for cluster_id, cluster_items in cluster_groups.items():
@@ -326,7 +349,7 @@ class PatternRecognizer:
 
         for line in log_lines:
             # Extract log level and tag
-            match = re.search(r"([VDIWEF])\s+([^:]+):", line)
+            match = _LEVEL_TAG_RE.search(line)
             if match:
                 level, tag = match.groups()
                 current_sequence.append((level, tag, line))
@@ -369,22 +392,24 @@ class PatternRecognizer:
 
         return patterns
 
-    def _normalize_message(self, message: str) -> str:
-        """Normalize log message for pattern matching"""
-        # Replace numbers with placeholder
-        normalized = re.sub(r"\b\d+\b", "<NUM>", message)
-
-        # Replace hex addresses
-        normalized = re.sub(r"0x[0-9a-fA-F]+", "<ADDR>", normalized)
+    def _group_messages(self, log_lines: List[str]) -> Dict[str, List[str]]:
+        """Group original log lines by their normalized message"""
+        groups = defaultdict(list)
+        normalize = self._normalize_message
 
-        # Replace file paths
-        normalized = re.sub(r"/[^\s]+", "<PATH>", normalized)
+        for line in log_lines:
+            # Extract message part after tag
+            match = _MESSAGE_RE.search(line)
+            if match:
+                groups[normalize(match.group(1))].append(line)
 
-        # Replace timestamps
-        normalized = re.sub(r"\d{2}:\d{2}:\d{2}", "<TIME>", normalized)
+        return groups
 
-        # Replace package names
-        normalized = re.sub(r"com\.[a-zA-Z0-9.]+", "<PACKAGE>", normalized)
+    def _normalize_message(self, message: str) -> str:
+        """Normalize log message for pattern matching"""
+        normalized = message
+        for regex, placeholder in _NORMALIZE_RULES:
+            normalized = regex.sub(placeholder, normalized)
 
         return normalized.strip()
 
@@ -423,7 +448,7 @@ class PatternRecognizer:
         # Split messages into words
         all_words = []
         for message in messages:
-            words = re.findall(r"\w+", message.lower())
+            words = _WORD_RE.findall(message.lower())
             all_words.extend(words)
 
         # Find most common words (excluding very common ones)
@@ -1,16 +1,22 @@
 import unittest
+import io
 import os
 import tempfile
 import json
 import gzip
 import shutil
+from unittest import mock
 from collections import Counter
+from . import log_analyzer
 from .log_analyzer import (
     LogEntry,
     parse_log_line,
     ISSUE_PATTERNS,
     read_log_file,
     read_logs_from_directory,
+    iter_log_lines,
+    smart_search_logs,
+    smart_search_logs_multi,
 )
 from .log_analyzer import (
     analyze_java_crash,
@@ -311,6 +317,22 @@ class TestJsonOutput(unittest.TestCase):
         finally:
             os.remove(tmp_path)
 
+    def test_dump_json_matches_dumps_json(self):
+        from . import utils
+
+        data = {"message": "caf\u00e9 \u65e5\u5fd7", "counts": [1, 2], "nested": {"ok": True}}
+        for orjson_available in (utils.ORJSON_AVAILABLE, False):
+            for indent in (False, True):
+                with self.subTest(orjson=orjson_available, indent=indent), mock.patch.object(
+                    utils, "ORJSON_AVAILABLE", orjson_available
+                ):
+                    buffer = io.BytesIO()
+                    utils.dump_json(data, buffer, indent=indent)
+                    self.assertFalse(buffer.closed)
+                    self.assertEqual(
+                        buffer.getvalue().decode("utf-8"), utils.dumps_json(data, indent=indent)
+                    )
+
 
 class TestExtendedReading(unittest.TestCase):
     def test_read_log_file_gzip(self):
@@ -328,6 +350,34 @@ class TestExtendedReading(unittest.TestCase):
         finally:
             os.remove(tmp_path)
 
+    def test_read_log_file_from_file_like(self):
+        log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
+        with open(log_path, "rb") as src:
+            data = src.read()
+
+        def summarize(issues):
+            return [(issue["type"], issue["trigger_line"].message) for issue in issues]
+
+        expected = summarize(read_log_file(log_path, ISSUE_PATTERNS))
+        self.assertEqual(
+            summarize(read_log_file(io.BytesIO(data), ISSUE_PATTERNS)), expected
+        )
+        self.assertEqual(
+            summarize(read_log_file(io.StringIO(data.decode("utf-8")), ISSUE_PATTERNS)),
+            expected,
+        )
+
+    def test_iter_log_lines_crlf_and_no_trailing_newline(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".log") as tmp:
+            tmp.write(b"first\r\nsecond\n\nthird")
+            tmp_path = tmp.name
+        try:
+            self.assertEqual(
+                list(iter_log_lines(tmp_path)), ["first", "second", "", "third"]
+            )
+        finally:
+            os.remove(tmp_path)
+
     def test_read_logs_from_directory(self):
         log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
         temp_dir = tempfile.mkdtemp()
@@ -341,6 +391,135 @@ class TestExtendedReading(unittest.TestCase):
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_read_logs_from_directory_process_pool(self):
+        log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for name in ("first.log", "second.log", "third.log"):
+                shutil.copy(log_path, os.path.join(temp_dir, name))
+            with mock.patch.object(log_analyzer, "_PARALLEL_MIN_BYTES", 0):
+                detected = read_logs_from_directory(
+                    temp_dir, ISSUE_PATTERNS, max_workers=2
+                )
+            counts = Counter(issue["type"] for issue in detected)
+            self.assertEqual(counts.get("JavaCrash", 0), 3)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_read_logs_from_directory_broken_pool_falls_back_inline(self):
+        log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for name in ("first.log", "second.log", "third.log"):
+                shutil.copy(log_path, os.path.join(temp_dir, name))
+            broken = mock.MagicMock()
+            broken.submit.return_value.result.side_effect = (
+                log_analyzer.BrokenProcessPool("worker died")
+            )
+            with mock.patch.object(log_analyzer, "_PARALLEL_MIN_BYTES", 0), mock.patch.object(
+                log_analyzer, "ProcessPoolExecutor"
+            ) as pool_cls:
+                pool_cls.return_value.__enter__.return_value = broken
+                detected = read_logs_from_directory(temp_dir, ISSUE_PATTERNS)
+            counts = Counter(issue["type"] for issue in detected)
+            self.assertEqual(counts.get("JavaCrash", 0), 3)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_frozen_build_skips_process_pool(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name in ("first.log", "second.log"):
+                path = os.path.join(temp_dir, name)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("line\n")
+                paths.append(path)
+            with mock.patch.object(log_analyzer, "_PARALLEL_MIN_BYTES", 0):
+                self.assertTrue(log_analyzer._use_process_pool(paths))
+                with mock.patch.object(log_analyzer.sys, "frozen", True, create=True):
+                    self.assertFalse(log_analyzer._use_process_pool(paths))
+
+
+class TestSmartSearch(unittest.TestCase):
+    def test_multi_search_matches_single_queries(self):
+        log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
+        queries = ["fatal", "FATAL EXCEPTION", "anr", "no such text"]
+        combined = smart_search_logs_multi(queries, [log_path], max_results=2)
+        self.assertEqual(list(combined), queries)
+        for query in queries:
+            self.assertEqual(
+                combined[query], smart_search_logs(query, [log_path], max_results=2)
+            )
+        self.assertEqual(combined["no such text"], [])
+
+    def test_multi_search_file_like_sources(self):
+        log_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.log")
+        with open(log_path, "rb") as f:
+            content = f.read()
+        queries = ["FATAL", "ANR"]
+        for intelligent in (True, False):
+            with self.subTest(intelligent=intelligent), mock.patch.object(
+                log_analyzer, "INTELLIGENT_FEATURES_AVAILABLE", intelligent
+            ):
+                expected = smart_search_logs_multi(queries, [log_path])
+                combined = smart_search_logs_multi(queries, [io.BytesIO(content)])
+                for query in queries:
+                    self.assertTrue(combined[query])
+                    self.assertEqual(
+                        [r["line_number"] for r in combined[query]],
+                        [r["line_number"] for r in expected[query]],
+                    )
+
+    def test_basic_search_caps_results_across_files(self):
+        sources = [
+            io.StringIO("match one\nmatch two\nother\n"),
+            io.StringIO("match three\n"),
+        ]
+        sources[0].name = "first.log"
+        results = log_analyzer.basic_search_logs_multi(
+            ["MATCH", "other", "missing"], sources, max_results=2
+        )
+        self.assertEqual(
+            [(r["file"], r["line_number"]) for r in results["MATCH"]],
+            [("first.log", 1), ("first.log", 2)],
+        )
+        self.assertEqual([r["content"] for r in results["other"]], ["other"])
+        self.assertEqual(results["missing"], [])
+        self.assertEqual(
+            log_analyzer.basic_search_logs("match", [io.StringIO("match\n")])[0]["file"],
+            "<stream>",
+        )
+
+
+class TestPrioritizeIssues(unittest.TestCase):
+    def test_scorer_failure_leaves_only_that_issue_unscored(self):
+        class FailingScorer:
+            def calculate_priority(self, issue, context=None):
+                if issue["message"] == "bad":
+                    raise ValueError("cannot score")
+                return {"total_score": 10, "priority": "low"}
+
+            def score_issues(self, issues, context=None):
+                return [self.calculate_priority(issue, context) for issue in issues]
+
+        issues = [
+            {"type": "ANR", "trigger_line_str": "good"},
+            {"type": "ANR", "trigger_line_str": "bad"},
+        ]
+        with mock.patch.object(
+            log_analyzer, "INTELLIGENT_FEATURES_AVAILABLE", True
+        ), mock.patch.object(
+            log_analyzer, "_get_priority_scorer", return_value=FailingScorer()
+        ), mock.patch.object(
+            log_analyzer, "_get_issue_message", side_effect=lambda issue: issue["trigger_line_str"]
+        ), self.assertLogs(log_analyzer.logger, level="ERROR"):
+            prioritized = log_analyzer.prioritize_issues(issues)
+
+        self.assertEqual(len(prioritized), 2)
+        self.assertEqual(prioritized[0]["trigger_line_str"], "good")
+        self.assertEqual(prioritized[0]["total_score"], 10)
+        self.assertNotIn("total_score", prioritized[1])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
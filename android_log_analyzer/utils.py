@@ -6,17 +6,81 @@ and other common tasks.
 """
 
 import functools
+import io
+import json
 import logging
+import sys
 import time
+from contextlib import redirect_stdout
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Iterator, List, Optional, TypeVar, Union
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, TypeVar, Union
+
+# orjson is optional; it is a much faster drop-in for json.dumps
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string, using orjson when installed.
+
+    Non-ASCII characters are written as-is and numpy arrays are encoded
+    natively with orjson; the stdlib fallback matches
+    ``json.dumps(obj, ensure_ascii=False)``.
+
+    Args:
+        obj: Object to serialize.
+        indent: Indent nested structures by two spaces.
+
+    Returns:
+        JSON document as a string.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dump_json(obj: Any, fp: BinaryIO, indent: bool = False) -> None:
+    """
+    Serialize an object as UTF-8 JSON into a binary file, using orjson when installed.
+
+    orjson's bytes are written straight to the file; the stdlib fallback
+    streams the document with ``json.dump`` instead of building it in
+    memory first. The output matches :func:`dumps_json` encoded as UTF-8.
+
+    Args:
+        obj: Object to serialize.
+        fp: File opened in binary write mode.
+        indent: Indent nested structures by two spaces.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        fp.write(orjson.dumps(obj, option=option))
+        return
+
+    text_fp = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+    try:
+        json.dump(obj, text_fp, indent=2 if indent else None, ensure_ascii=False)
+        text_fp.flush()
+    finally:
+        # Leave the caller's file open
+        text_fp.detach()
+
+
 def timing_decorator(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to measure function execution time.
@@ -46,6 +110,34 @@ def timing_decorator(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def buffered_output(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator that collects everything a function prints and writes it to
+    stdout in one call when the function returns or raises.
+
+    Useful for chatty demo and report functions whose many print() calls
+    would otherwise each cost a write (and, on a pipe, a flush).
+
+    Args:
+        func: Function whose stdout output should be buffered.
+
+    Returns:
+        Wrapped function that emits its output with a single write.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
+
+
 def batch_process(
     items: List[T],
     processor: Callable[[T], Any],
@@ -7,6 +7,7 @@ like SPRD ylog files with multiple subsystems.
 """
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 
@@ -64,14 +65,14 @@ def demo_ylog_analysis():
         # Display subsystem analysis
         subsystem_analysis = results.get('subsystem_analysis', {})
         if subsystem_analysis:
-            print("\n🔬 Subsystem Analysis:")
-            print("-" * 30)
+            lines = ["\n🔬 Subsystem Analysis:", "-" * 30]
             for subsystem_name, subsystem_data in subsystem_analysis.items():
                 issue_count = len(subsystem_data.get('issues', []))
                 file_count = subsystem_data.get('file_count', 0)
                 total_size = format_file_size(subsystem_data.get('total_size', 0))
-                print(f"  {subsystem_name.capitalize()}:")
-                print(f"    Files: {file_count}, Size: {total_size}, Issues: {issue_count}")
+                lines.append(f"  {subsystem_name.capitalize()}:")
+                lines.append(f"    Files: {file_count}, Size: {total_size}, Issues: {issue_count}")
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         # Display critical issues
         critical_issues = results.get('critical_issues', [])
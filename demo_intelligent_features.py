@@ -138,16 +138,17 @@ def demo_priority_scoring():
         release_stage="production"
     )
     
-    print("🎯 Individual Issue Scoring:")
+    lines = ["🎯 Individual Issue Scoring:"]
     for i, issue in enumerate(sample_issues, 1):
         priority_info = scorer.calculate_priority(issue, context)
         
-        print(f"\n{i}. {issue['type'].replace('_', ' ').title()}")
-        print(f"   Priority: {priority_info['priority'].upper()} (Score: {priority_info['total_score']})")
-        print(f"   Breakdown: Severity={priority_info['breakdown']['severity_score']:.1f}, "
-              f"Frequency={priority_info['breakdown']['frequency_score']:.1f}, "
-              f"Impact={priority_info['breakdown']['system_impact_score']:.1f}")
-        print(f"   Top Recommendation: {priority_info['recommendations'][0]}")
+        lines.append(f"\n{i}. {issue['type'].replace('_', ' ').title()}")
+        lines.append(f"   Priority: {priority_info['priority'].upper()} (Score: {priority_info['total_score']})")
+        lines.append(f"   Breakdown: Severity={priority_info['breakdown']['severity_score']:.1f}, "
+                     f"Frequency={priority_info['breakdown']['frequency_score']:.1f}, "
+                     f"Impact={priority_info['breakdown']['system_impact_score']:.1f}")
+        lines.append(f"   Top Recommendation: {priority_info['recommendations'][0]}")
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Batch prioritization
     print(f"\n📋 Batch Prioritization (sorted by priority):")
@@ -9,115 +9,126 @@ This script demonstrates the successful implementation of Phase 0 intelligent fe
 - End-to-end intelligent analysis workflow
 """
 
+import io
 import sys
-import tempfile
+from collections import defaultdict
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from android_log_analyzer.log_analyzer import read_log_file, smart_search_logs, prioritize_issues
+from android_log_analyzer.log_analyzer import read_log_file, smart_search_logs_multi, prioritize_issues
 from android_log_analyzer.intelligent.smart_search import SmartSearchEngine
 from android_log_analyzer.intelligent.priority_scorer import IssuePriorityScorer, IssueContext
 from android_log_analyzer.intelligent.report_generator import IntelligentReportGenerator
+from android_log_analyzer.utils import buffered_output
 
+# Sample logs are module-level bytes so each demo can wrap them in a
+# BytesIO without rebuilding or re-encoding the text on every run
 
+# Sample log content for the smart search demo
+_SEARCH_SAMPLE_LOG = (
+    b"01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main\n"
+    b"01-01 10:00:00.124  1234  1234 E AndroidRuntime: java.lang.NullPointerException\n"
+    b"01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app\n"
+    b"01-01 10:00:02.300  2345  2345 W AudioFlinger: write blocked for 150 msecs\n"
+    b"01-01 10:00:03.400  3456  3456 E WifiManager: Failed to connect: timeout\n"
+    b"01-01 10:00:04.500  4567  4567 E System: OutOfMemoryError: Failed to allocate"
+)
+
+# Test log with various issues for the priority scoring demo
+_PRIORITY_SAMPLE_LOG = b'''
+01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
+01-01 10:00:00.124  1234  1234 E AndroidRuntime: java.lang.NullPointerException
+01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app
+01-01 10:00:02.300  2345  2345 E lowmemorykiller: Killing process 9876
+01-01 10:00:03.400  3456  3456 E DEBUG: Fatal signal 11 (SIGSEGV)
+01-01 10:00:04.500  4567  4567 W AudioFlinger: write blocked for 150 msecs
+'''
+
+# Comprehensive test log for the end-to-end workflow demo
+_WORKFLOW_SAMPLE_LOG = b'''
+01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
+01-01 10:00:00.124  1234  1234 E AndroidRuntime: Process: com.example.app, PID: 1234
+01-01 10:00:00.125  1234  1234 E AndroidRuntime: java.lang.NullPointerException
+01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app: Input dispatching timed out
+01-01 10:00:02.300  2345  2345 E lowmemorykiller: Killing process 9876 (com.example.app)
+01-01 10:00:03.400  3456  3456 E DEBUG: Fatal signal 11 (SIGSEGV), code 1
+01-01 10:00:04.500  4567  4567 W AudioFlinger: write blocked for 150 msecs, 5 delayed writes
+01-01 10:00:05.600  5678  5678 E WifiManager: Failed to connect to network: timeout
+01-01 10:00:06.700  6789  6789 E SystemServer: System server crashed
+01-01 10:00:07.800  7890  7890 W Performance: Slow operation detected: 2500ms
+'''
+
+
+@buffered_output
 def demo_integrated_smart_search():
     """Demonstrate integrated smart search functionality"""
     print("🔍 Integrated Smart Search Demo")
     print("=" * 50)
     
-    # Create sample log content
-    sample_logs = [
-        "01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-        "01-01 10:00:00.124  1234  1234 E AndroidRuntime: java.lang.NullPointerException",
-        "01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app",
-        "01-01 10:00:02.300  2345  2345 W AudioFlinger: write blocked for 150 msecs",
-        "01-01 10:00:03.400  3456  3456 E WifiManager: Failed to connect: timeout",
-        "01-01 10:00:04.500  4567  4567 E System: OutOfMemoryError: Failed to allocate"
+    # Analyze straight from memory instead of a temporary file
+    log_buffer = io.BytesIO(_SEARCH_SAMPLE_LOG)
+    
+    # Test smart search queries
+    queries = [
+        "crashes",
+        "memory problems", 
+        "timeout",
+        "audio issues"
     ]
     
-    # Create temporary log file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-        f.write('\n'.join(sample_logs))
-        temp_path = f.name
+    # Scan the file once for all queries
+    results_by_query = smart_search_logs_multi(queries, [log_buffer], max_results=3)
     
-    try:
-        # Test smart search queries
-        queries = [
-            "crashes",
-            "memory problems", 
-            "timeout",
-            "audio issues"
-        ]
+    for query, results in results_by_query.items():
+        print(f"\n🔎 Query: '{query}'")
         
-        for query in queries:
-            print(f"\n🔎 Query: '{query}'")
-            results = smart_search_logs(query, [temp_path], max_results=3)
-            
-            if results:
-                print(f"   Found {len(results)} results:")
-                for result in results:
-                    print(f"   - Line {result['line_number']}: {result['content'][:60]}...")
-                    print(f"     Relevance: {result['relevance_score']:.2f}")
-            else:
-                print("   No results found")
-    
-    finally:
-        import os
-        os.unlink(temp_path)
+        if results:
+            print(f"   Found {len(results)} results:")
+            for result in results:
+                print(f"   - Line {result['line_number']}: {result['content'][:60]}...")
+                print(f"     Relevance: {result['relevance_score']:.2f}")
+        else:
+            print("   No results found")
 
 
+@buffered_output
 def demo_integrated_priority_scoring():
     """Demonstrate integrated priority scoring"""
     print("\n\n📊 Integrated Priority Scoring Demo")
     print("=" * 50)
     
-    # Create test log with various issues
-    test_log_content = '''
-01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
-01-01 10:00:00.124  1234  1234 E AndroidRuntime: java.lang.NullPointerException
-01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app
-01-01 10:00:02.300  2345  2345 E lowmemorykiller: Killing process 9876
-01-01 10:00:03.400  3456  3456 E DEBUG: Fatal signal 11 (SIGSEGV)
-01-01 10:00:04.500  4567  4567 W AudioFlinger: write blocked for 150 msecs
-'''
+    # Analyze straight from memory instead of a temporary file
+    log_buffer = io.BytesIO(_PRIORITY_SAMPLE_LOG)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-        f.write(test_log_content)
-        temp_path = f.name
+    # Analyze log file
+    issues = read_log_file(log_buffer)
+    print(f"📋 Detected {len(issues)} issues")
     
-    try:
-        # Analyze log file
-        issues = read_log_file(temp_path)
-        print(f"📋 Detected {len(issues)} issues")
-        
-        # Apply intelligent prioritization
-        context = {
-            'app_version': '2.1.0',
-            'user_count_affected': 500,
-            'release_stage': 'production'
-        }
-        
-        prioritized_issues = prioritize_issues(issues, context)
-        
-        print(f"\n🎯 Prioritized Issues:")
-        for i, issue in enumerate(prioritized_issues, 1):
-            issue_type = issue.get('type', 'Unknown')
-            priority = issue.get('priority', 'N/A')
-            score = issue.get('total_score', 'N/A')
-            recommendations = issue.get('recommendations', [])
-            
-            print(f"\n{i}. {issue_type}")
-            print(f"   Priority: {priority.upper()} (Score: {score})")
-            if recommendations:
-                print(f"   Recommendation: {recommendations[0]}")
+    # Apply intelligent prioritization
+    context = {
+        'app_version': '2.1.0',
+        'user_count_affected': 500,
+        'release_stage': 'production'
+    }
+    
+    prioritized_issues = prioritize_issues(issues, context)
     
-    finally:
-        import os
-        os.unlink(temp_path)
+    print(f"\n🎯 Prioritized Issues:")
+    for i, issue in enumerate(prioritized_issues, 1):
+        issue_type = issue.get('type', 'Unknown')
+        priority = issue.get('priority', 'N/A')
+        score = issue.get('total_score', 'N/A')
+        recommendations = issue.get('recommendations', [])
+        
+        print(f"\n{i}. {issue_type}")
+        print(f"   Priority: {priority.upper()} (Score: {score})")
+        if recommendations:
+            print(f"   Recommendation: {recommendations[0]}")
 
 
+@buffered_output
 def demo_gui_integration():
     """Demonstrate GUI integration capabilities"""
     print("\n\n🎨 GUI Integration Demo")
@@ -143,66 +154,54 @@ def demo_gui_integration():
     print("   - Dark mode support")
 
 
+@buffered_output
 def demo_end_to_end_workflow():
     """Demonstrate complete end-to-end intelligent workflow"""
     print("\n\n🔄 End-to-End Intelligent Workflow Demo")
     print("=" * 50)
     
-    # Create comprehensive test log
-    comprehensive_log = '''
-01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
-01-01 10:00:00.124  1234  1234 E AndroidRuntime: Process: com.example.app, PID: 1234
-01-01 10:00:00.125  1234  1234 E AndroidRuntime: java.lang.NullPointerException
-01-01 10:00:01.200  5678  5678 I ActivityManager: ANR in com.example.app: Input dispatching timed out
-01-01 10:00:02.300  2345  2345 E lowmemorykiller: Killing process 9876 (com.example.app)
-01-01 10:00:03.400  3456  3456 E DEBUG: Fatal signal 11 (SIGSEGV), code 1
-01-01 10:00:04.500  4567  4567 W AudioFlinger: write blocked for 150 msecs, 5 delayed writes
-01-01 10:00:05.600  5678  5678 E WifiManager: Failed to connect to network: timeout
-01-01 10:00:06.700  6789  6789 E SystemServer: System server crashed
-01-01 10:00:07.800  7890  7890 W Performance: Slow operation detected: 2500ms
-'''
+    # Analyze straight from memory instead of a temporary file
+    log_buffer = io.BytesIO(_WORKFLOW_SAMPLE_LOG)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-        f.write(comprehensive_log)
-        temp_path = f.name
+    print("1️⃣ Log Analysis")
+    issues = read_log_file(log_buffer)
+    print(f"   Detected {len(issues)} issues")
     
-    try:
-        print("1️⃣ Log Analysis")
-        issues = read_log_file(temp_path)
-        print(f"   Detected {len(issues)} issues")
-        
-        print("\n2️⃣ Intelligent Prioritization")
-        prioritized_issues = prioritize_issues(issues)
-        critical_count = sum(1 for issue in prioritized_issues if issue.get('priority') == 'critical')
-        high_count = sum(1 for issue in prioritized_issues if issue.get('priority') == 'high')
-        print(f"   Critical: {critical_count}, High: {high_count}")
-        
-        print("\n3️⃣ Smart Search Capabilities")
-        search_queries = ["crashes", "memory", "performance"]
-        for query in search_queries:
-            results = smart_search_logs(query, [temp_path], max_results=2)
-            print(f"   '{query}': {len(results)} results")
-        
-        print("\n4️⃣ Intelligent Report Generation")
-        report_generator = IntelligentReportGenerator()
-        
-        # Create mock analysis data
-        analysis_data = {
-            'package_info': {'name': 'test.log', 'total_files': 1},
-            'summary': {'total_issues': len(issues), 'critical_issues': critical_count},
-            'critical_issues': [issue for issue in prioritized_issues if issue.get('priority') == 'critical']
-        }
-        
-        report = report_generator.generate_comprehensive_report(analysis_data)
-        print(f"   Generated report: {len(report)} characters")
-        
-        print("\n✅ Complete intelligent workflow executed successfully!")
-        
-    finally:
-        import os
-        os.unlink(temp_path)
+    print("\n2️⃣ Intelligent Prioritization")
+    prioritized_issues = prioritize_issues(issues)
+    # Bucket issues by priority in one pass; counts are the bucket sizes
+    issues_by_priority = defaultdict(list)
+    for issue in prioritized_issues:
+        issues_by_priority[issue.get('priority')].append(issue)
+    critical_issues = issues_by_priority['critical']
+    critical_count = len(critical_issues)
+    high_count = len(issues_by_priority['high'])
+    print(f"   Critical: {critical_count}, High: {high_count}")
+    
+    print("\n3️⃣ Smart Search Capabilities")
+    search_queries = ["crashes", "memory", "performance"]
+    log_buffer.seek(0)
+    results_by_query = smart_search_logs_multi(search_queries, [log_buffer], max_results=2)
+    for query, results in results_by_query.items():
+        print(f"   '{query}': {len(results)} results")
+    
+    print("\n4️⃣ Intelligent Report Generation")
+    report_generator = IntelligentReportGenerator()
+    
+    # Create mock analysis data
+    analysis_data = {
+        'package_info': {'name': 'test.log', 'total_files': 1},
+        'summary': {'total_issues': len(issues), 'critical_issues': critical_count},
+        'critical_issues': critical_issues
+    }
+    
+    report = report_generator.generate_comprehensive_report(analysis_data)
+    print(f"   Generated report: {len(report)} characters")
+    
+    print("\n✅ Complete intelligent workflow executed successfully!")
 
 
+@buffered_output
 def demo_performance_improvements():
     """Demonstrate performance improvements"""
     print("\n\n⚡ Performance Improvements Demo")
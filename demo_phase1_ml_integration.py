@@ -9,36 +9,129 @@ This script demonstrates the successful implementation of Phase 1 AI/ML features
 - ML-enhanced analysis workflow
 """
 
+import io
 import sys
-import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    from android_log_analyzer.ml import (
-        create_ml_analyzer, get_ml_capabilities, check_ml_health, 
-        demo_ml_features, ML_DEPENDENCIES_AVAILABLE
-    )
-    from android_log_analyzer.ml.models.crash_classifier import CrashClassifier
-    from android_log_analyzer.ml.models.anomaly_detector import AnomalyDetector
-    from android_log_analyzer.ml.models.pattern_recognizer import PatternRecognizer
-    from android_log_analyzer.log_analyzer import analyze_with_ml, get_ml_enhanced_report
-    ML_IMPORT_SUCCESS = True
-except ImportError as e:
-    print(f"⚠️  ML features not available: {e}")
-    print("💡 To enable ML features, install dependencies:")
-    print("   pip install scikit-learn numpy")
-    ML_IMPORT_SUCCESS = False
+from android_log_analyzer.utils import buffered_output
 
 
+@lru_cache(maxsize=1)
+def _load_ml():
+    """
+    Import the ML modules on first use
+
+    Keeps numpy, scikit-learn and the model modules off the import path
+    until a demo actually needs them. Returns whether the import succeeded.
+    """
+    global create_ml_analyzer, get_ml_capabilities, check_ml_health
+    global demo_ml_features, ML_DEPENDENCIES_AVAILABLE
+    global CrashClassifier, AnomalyDetector, PatternRecognizer
+    global analyze_with_ml, get_ml_enhanced_report
+
+    try:
+        from android_log_analyzer.ml import (
+            create_ml_analyzer, get_ml_capabilities, check_ml_health, 
+            demo_ml_features, ML_DEPENDENCIES_AVAILABLE
+        )
+        from android_log_analyzer.ml.models.crash_classifier import CrashClassifier
+        from android_log_analyzer.ml.models.anomaly_detector import AnomalyDetector
+        from android_log_analyzer.ml.models.pattern_recognizer import PatternRecognizer
+        from android_log_analyzer.log_analyzer import analyze_with_ml, get_ml_enhanced_report
+        return True
+    except ImportError as e:
+        print(f"⚠️  ML features not available: {e}")
+        print("💡 To enable ML features, install dependencies:")
+        print("   pip install scikit-learn numpy")
+        return False
+
+
+# Sample logs live at module level so the demos reuse them instead of
+# rebuilding the literals (and re-encoding the text) on every run
+
+# Normal log lines for the anomaly detector demo
+_NORMAL_LOGS = (
+    "01-01 10:00:00.123  1234  1234 I ActivityManager: Start proc com.example.app",
+    "01-01 10:00:01.234  1234  1234 D MyApp: User clicked button",
+    "01-01 10:00:02.345  1234  1234 I MyApp: Loading data from server",
+    "01-01 10:00:03.456  1234  1234 D MyApp: Data loaded successfully",
+)
+
+# Log lines with repeated crashes and stalls for the anomaly detector demo
+_ANOMALOUS_LOGS = (
+    "01-01 10:00:04.567  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:04.568  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:04.569  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:04.570  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:04.571  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:05.678  5678  5678 E System: OutOfMemoryError: Failed to allocate",
+    "01-01 10:00:06.789  6789  6789 W AudioFlinger: write blocked for 2000 msecs",
+    "01-01 10:00:07.890  7890  7890 W AudioFlinger: write blocked for 2000 msecs",
+    "01-01 10:00:08.901  8901  8901 W AudioFlinger: write blocked for 2000 msecs",
+)
+
+# Log lines with recurring patterns for the pattern recognizer demo
+_PATTERN_SAMPLE_LOGS = (
+    "01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:01.234  1234  1234 E AndroidRuntime: java.lang.NullPointerException",
+    "01-01 10:00:02.345  1234  1234 I ActivityManager: Killing 5678:com.example.app",
+    "01-01 10:00:03.456  2345  2345 E AndroidRuntime: FATAL EXCEPTION: main",
+    "01-01 10:00:04.567  2345  2345 E AndroidRuntime: java.lang.IllegalStateException",
+    "01-01 10:00:05.678  2345  2345 I ActivityManager: Killing 6789:com.example.app",
+    "01-01 10:00:06.789  3456  3456 W AudioFlinger: write blocked for 150 msecs",
+    "01-01 10:00:07.890  3456  3456 W AudioFlinger: write blocked for 200 msecs",
+    "01-01 10:00:08.901  3456  3456 W AudioFlinger: write blocked for 180 msecs",
+    "01-01 10:00:09.012  4567  4567 E lowmemorykiller: Killing process 1111",
+    "01-01 10:00:10.123  4567  4567 E lowmemorykiller: Killing process 2222",
+    "01-01 10:00:11.234  4567  4567 E lowmemorykiller: Killing process 3333",
+)
+
+# Comprehensive test log for the ML-enhanced analysis demo
+_COMPREHENSIVE_LOG = b'''
+01-01 10:00:00.123  1234  1234 I ActivityManager: Start proc com.example.app
+01-01 10:00:01.234  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
+01-01 10:00:01.235  1234  1234 E AndroidRuntime: Process: com.example.app, PID: 1234
+01-01 10:00:01.236  1234  1234 E AndroidRuntime: java.lang.NullPointerException
+01-01 10:00:02.345  5678  5678 I ActivityManager: ANR in com.example.app
+01-01 10:00:03.456  2345  2345 E DEBUG: Fatal signal 11 (SIGSEGV), code 1
+01-01 10:00:04.567  3456  3456 E System: OutOfMemoryError: Failed to allocate 8MB
+01-01 10:00:05.678  4567  4567 W AudioFlinger: write blocked for 150 msecs
+01-01 10:00:06.789  4567  4567 W AudioFlinger: write blocked for 200 msecs
+01-01 10:00:07.890  5678  5678 E lowmemorykiller: Killing process 9999
+01-01 10:00:08.901  6789  6789 E WifiManager: Failed to connect: timeout
+01-01 10:00:09.012  7890  7890 W Performance: Slow operation detected: 2500ms
+'''
+
+
+@lru_cache(maxsize=1)
+def _classifier():
+    """Shared crash classifier, trained once on first use"""
+    return CrashClassifier()
+
+
+@lru_cache(maxsize=1)
+def _detector():
+    """Shared anomaly detector"""
+    return AnomalyDetector()
+
+
+@lru_cache(maxsize=1)
+def _recognizer():
+    """Shared pattern recognizer"""
+    return PatternRecognizer()
+
+
+@buffered_output
 def demo_ml_capabilities():
     """Demonstrate ML capabilities and status"""
     print("🧠 ML Capabilities Assessment")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ ML modules could not be imported")
         print("📦 Required packages: scikit-learn, numpy")
         return False
@@ -60,17 +153,18 @@ def demo_ml_capabilities():
     return capabilities['ml_dependencies_available']
 
 
+@buffered_output
 def demo_crash_classifier():
     """Demonstrate crash classification capabilities"""
     print("\n\n🔥 Crash Classifier Demo")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ Crash classifier not available")
         return
     
     try:
-        classifier = CrashClassifier()
+        classifier = _classifier()
         
         # Test different types of crashes
         test_crashes = [
@@ -83,9 +177,9 @@ def demo_crash_classifier():
         
         print(f"🔍 Analyzing {len(test_crashes)} crash samples:")
         
-        for i, crash_text in enumerate(test_crashes, 1):
-            prediction = classifier.classify_crash(crash_text)
-            
+        predictions = classifier.batch_classify(test_crashes)
+        
+        for i, (crash_text, prediction) in enumerate(zip(test_crashes, predictions), 1):
             print(f"\n{i}. Crash: {crash_text[:60]}...")
             print(f"   Type: {prediction.crash_type}")
             print(f"   Confidence: {prediction.confidence:.2f}")
@@ -104,39 +198,20 @@ def demo_crash_classifier():
         print(f"❌ Crash classifier demo failed: {e}")
 
 
+@buffered_output
 def demo_anomaly_detector():
     """Demonstrate anomaly detection capabilities"""
     print("\n\n🚨 Anomaly Detector Demo")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ Anomaly detector not available")
         return
     
     try:
-        detector = AnomalyDetector()
+        detector = _detector()
         
-        # Create sample log with anomalies
-        normal_logs = [
-            "01-01 10:00:00.123  1234  1234 I ActivityManager: Start proc com.example.app",
-            "01-01 10:00:01.234  1234  1234 D MyApp: User clicked button",
-            "01-01 10:00:02.345  1234  1234 I MyApp: Loading data from server",
-            "01-01 10:00:03.456  1234  1234 D MyApp: Data loaded successfully"
-        ]
-        
-        anomalous_logs = [
-            "01-01 10:00:04.567  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:04.568  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:04.569  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:04.570  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:04.571  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:05.678  5678  5678 E System: OutOfMemoryError: Failed to allocate",
-            "01-01 10:00:06.789  6789  6789 W AudioFlinger: write blocked for 2000 msecs",
-            "01-01 10:00:07.890  7890  7890 W AudioFlinger: write blocked for 2000 msecs",
-            "01-01 10:00:08.901  8901  8901 W AudioFlinger: write blocked for 2000 msecs"
-        ]
-        
-        all_logs = normal_logs + anomalous_logs
+        all_logs = _NORMAL_LOGS + _ANOMALOUS_LOGS
         
         print(f"🔍 Analyzing {len(all_logs)} log lines for anomalies:")
         
@@ -165,38 +240,23 @@ def demo_anomaly_detector():
         print(f"❌ Anomaly detector demo failed: {e}")
 
 
+@buffered_output
 def demo_pattern_recognizer():
     """Demonstrate pattern recognition capabilities"""
     print("\n\n🔍 Pattern Recognizer Demo")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ Pattern recognizer not available")
         return
     
     try:
-        recognizer = PatternRecognizer()
+        recognizer = _recognizer()
         
-        # Create sample logs with patterns
-        sample_logs = [
-            "01-01 10:00:00.123  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:01.234  1234  1234 E AndroidRuntime: java.lang.NullPointerException",
-            "01-01 10:00:02.345  1234  1234 I ActivityManager: Killing 5678:com.example.app",
-            "01-01 10:00:03.456  2345  2345 E AndroidRuntime: FATAL EXCEPTION: main",
-            "01-01 10:00:04.567  2345  2345 E AndroidRuntime: java.lang.IllegalStateException",
-            "01-01 10:00:05.678  2345  2345 I ActivityManager: Killing 6789:com.example.app",
-            "01-01 10:00:06.789  3456  3456 W AudioFlinger: write blocked for 150 msecs",
-            "01-01 10:00:07.890  3456  3456 W AudioFlinger: write blocked for 200 msecs",
-            "01-01 10:00:08.901  3456  3456 W AudioFlinger: write blocked for 180 msecs",
-            "01-01 10:00:09.012  4567  4567 E lowmemorykiller: Killing process 1111",
-            "01-01 10:00:10.123  4567  4567 E lowmemorykiller: Killing process 2222",
-            "01-01 10:00:11.234  4567  4567 E lowmemorykiller: Killing process 3333"
-        ]
-        
-        print(f"🔍 Analyzing {len(sample_logs)} log lines for patterns:")
+        print(f"🔍 Analyzing {len(_PATTERN_SAMPLE_LOGS)} log lines for patterns:")
         
         # Recognize patterns
-        patterns = recognizer.recognize_patterns(sample_logs)
+        patterns = recognizer.recognize_patterns(_PATTERN_SAMPLE_LOGS)
         
         print(f"\n📊 Pattern Recognition Results:")
         print(f"   Total patterns detected: {len(patterns)}")
@@ -223,86 +283,66 @@ def demo_pattern_recognizer():
         print(f"❌ Pattern recognizer demo failed: {e}")
 
 
+@buffered_output
 def demo_ml_enhanced_analysis():
     """Demonstrate ML-enhanced analysis workflow"""
     print("\n\n🚀 ML-Enhanced Analysis Demo")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ ML-enhanced analysis not available")
         return
     
-    # Create comprehensive test log
-    comprehensive_log = '''
-01-01 10:00:00.123  1234  1234 I ActivityManager: Start proc com.example.app
-01-01 10:00:01.234  1234  1234 E AndroidRuntime: FATAL EXCEPTION: main
-01-01 10:00:01.235  1234  1234 E AndroidRuntime: Process: com.example.app, PID: 1234
-01-01 10:00:01.236  1234  1234 E AndroidRuntime: java.lang.NullPointerException
-01-01 10:00:02.345  5678  5678 I ActivityManager: ANR in com.example.app
-01-01 10:00:03.456  2345  2345 E DEBUG: Fatal signal 11 (SIGSEGV), code 1
-01-01 10:00:04.567  3456  3456 E System: OutOfMemoryError: Failed to allocate 8MB
-01-01 10:00:05.678  4567  4567 W AudioFlinger: write blocked for 150 msecs
-01-01 10:00:06.789  4567  4567 W AudioFlinger: write blocked for 200 msecs
-01-01 10:00:07.890  5678  5678 E lowmemorykiller: Killing process 9999
-01-01 10:00:08.901  6789  6789 E WifiManager: Failed to connect: timeout
-01-01 10:00:09.012  7890  7890 W Performance: Slow operation detected: 2500ms
-'''
+    # Analyze straight from memory instead of a temporary file
+    log_buffer = io.BytesIO(_COMPREHENSIVE_LOG)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-        f.write(comprehensive_log)
-        temp_path = f.name
+    print("🔍 Performing ML-enhanced analysis...")
     
-    try:
-        print("🔍 Performing ML-enhanced analysis...")
-        
-        # Get ML-enhanced report
-        report = get_ml_enhanced_report(temp_path)
-        
-        if 'error' in report:
-            print(f"❌ Analysis failed: {report['error']}")
-            return
-        
-        print(f"\n📊 Analysis Results:")
-        print(f"   Total log lines: {report['total_lines']}")
-        print(f"   Standard issues: {report['standard_analysis']['issue_count']}")
-        
-        ml_analysis = report['ml_analysis']
-        if ml_analysis.get('ml_available'):
-            print(f"   ML crashes classified: {len(ml_analysis['crash_classifications'])}")
-            print(f"   Anomalies detected: {len(ml_analysis['anomalies'])}")
-            print(f"   Patterns recognized: {len(ml_analysis['patterns'])}")
-            
-            # Show ML insights
-            insights = ml_analysis.get('ml_insights', {})
-            if 'health_score' in insights:
-                print(f"   System health score: {insights['health_score']}/100")
-            
-            # Show crash insights
-            crash_insights = insights.get('crash_insights', {})
-            if crash_insights:
-                print(f"   Most common crash type: {crash_insights.get('most_common_type', 'N/A')}")
-                print(f"   Critical crashes: {crash_insights.get('critical_crashes', 0)}")
-            
-            # Show enhanced insights
-            enhanced = report.get('enhanced_insights', {})
-            if enhanced.get('recommendations'):
-                print(f"\n💡 Recommendations:")
-                for rec in enhanced['recommendations']:
-                    print(f"   - {rec}")
-        else:
-            print("   ML analysis: Not available")
-        
-    finally:
-        import os
-        os.unlink(temp_path)
+    # Get ML-enhanced report
+    report = get_ml_enhanced_report(log_buffer)
+    
+    if 'error' in report:
+        print(f"❌ Analysis failed: {report['error']}")
+        return
+    
+    print(f"\n📊 Analysis Results:")
+    print(f"   Total log lines: {report['total_lines']}")
+    print(f"   Standard issues: {report['standard_analysis']['issue_count']}")
+    
+    ml_analysis = report['ml_analysis']
+    if ml_analysis.get('ml_available'):
+        print(f"   ML crashes classified: {len(ml_analysis['crash_classifications'])}")
+        print(f"   Anomalies detected: {len(ml_analysis['anomalies'])}")
+        print(f"   Patterns recognized: {len(ml_analysis['patterns'])}")
+        
+        # Show ML insights
+        insights = ml_analysis.get('ml_insights', {})
+        if 'health_score' in insights:
+            print(f"   System health score: {insights['health_score']}/100")
+        
+        # Show crash insights
+        crash_insights = insights.get('crash_insights', {})
+        if crash_insights:
+            print(f"   Most common crash type: {crash_insights.get('most_common_type', 'N/A')}")
+            print(f"   Critical crashes: {crash_insights.get('critical_crashes', 0)}")
+        
+        # Show enhanced insights
+        enhanced = report.get('enhanced_insights', {})
+        if enhanced.get('recommendations'):
+            print(f"\n💡 Recommendations:")
+            for rec in enhanced['recommendations']:
+                print(f"   - {rec}")
+    else:
+        print("   ML analysis: Not available")
 
 
+@buffered_output
 def demo_ml_health_check():
     """Demonstrate ML health monitoring"""
     print("\n\n🏥 ML Health Check Demo")
     print("=" * 50)
     
-    if not ML_IMPORT_SUCCESS:
+    if not _load_ml():
         print("❌ ML health check not available")
         return
     
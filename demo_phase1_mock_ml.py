@@ -7,16 +7,199 @@ that don't require external ML libraries. Shows the architecture and
 capabilities that would be available with full ML dependencies.
 """
 
+import io
+import os
+import re
 import sys
 import tempfile
 import random
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from functools import wraps
+from itertools import accumulate, chain
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+def buffered_output(func):
+    """Collect a demo's print() output and write it to stdout in one call"""
+    # Kept local: importing android_log_analyzer.utils would load the whole
+    # analyzer package, which this mock demo is meant to run without
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    
+    return wrapper
+
+
+# Keywords the mock models look for, each mapped to a bit flag so a single
+# scan of a line yields every keyword it contains as one integer mask
+_KEYWORDS = (
+    'java.lang', 'exception', 'fatal signal', 'fatal', 'sigsegv', 'anr',
+    'outofmemoryerror', 'oom', 'memory', 'error', 'system', 'crash',
+    'slow', 'timeout', 'blocked',
+)
+_FLAGS = {keyword: 1 << bit for bit, keyword in enumerate(_KEYWORDS)}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation of words with their shared prefixes factored out"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # a word ends here
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            # Greedy, so the longer word wins when both match
+            return '(?:' + '|'.join(branches) + ')?'
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie)
+
+
+# All keywords as one trie-shaped, case-insensitive alternation, e.g.
+# 'o(?:om|utofmemoryerror)', so the engine branches once per character
+# instead of trying each keyword in turn. Matches don't overlap, so a
+# keyword's mask also carries the flags of keywords it contains
+# ('fatal signal' implies 'fatal', 'outofmemoryerror' implies 'memory' and
+# 'error'). Logcat text is ASCII, so case folding is restricted to ASCII:
+# cheaper than Unicode folding and, unlike it, never matches e.g. 'ſlow'
+# (which str.lower() leaves alone).
+_KEYWORD_RE = re.compile(_trie_pattern(_KEYWORDS), re.IGNORECASE | re.ASCII)
+_KEYWORD_MASKS = {
+    keyword: sum(flag for other, flag in _FLAGS.items() if other in keyword)
+    for keyword in _KEYWORDS
+}
+
+# Batches at least this long are split into chunks scanned in worker
+# processes; below it, process startup costs more than the scan
+_PARALLEL_MIN_LINES = 16_000
+_PARALLEL_CHUNK_LINES = 4_096
+
+_CRASH_FLAGS = _FLAGS['exception'] | _FLAGS['fatal']
+_CRASH_LINE_FLAGS = _CRASH_FLAGS | _FLAGS['sigsegv']
+_ERROR_FLAGS = _FLAGS['error'] | _FLAGS['exception']
+_MEMORY_FLAGS = _FLAGS['memory'] | _FLAGS['oom']
+_PERF_FLAGS = _FLAGS['slow'] | _FLAGS['timeout'] | _FLAGS['blocked']
+
+# Mock pattern buckets in report order, as (flags, pattern_id, pattern_type,
+# description, confidence, severity, recommendations)
+_PATTERN_BUCKETS = (
+    (_CRASH_FLAGS, 'crash_sequence_001', 'template',
+     'Application crash sequence detected', 0.9, 'critical',
+     ('Analyze crash stack trace', 'Fix null pointer exceptions')),
+    (_MEMORY_FLAGS, 'memory_pattern_001', 'frequency',
+     'Memory pressure indicators', 0.8, 'high',
+     ('Monitor memory usage', 'Optimize allocations')),
+    (_PERF_FLAGS, 'performance_pattern_001', 'ml_cluster',
+     'Performance degradation signs', 0.75, 'medium',
+     ('Profile performance', 'Optimize slow operations')),
+)
+_BUCKET_FLAGS = tuple(bucket[0] for bucket in _PATTERN_BUCKETS)
+
+# Crash classification rules, checked in order, as
+# (flag sets, crash_type, severity, confidence). A rule matches when a line's
+# keyword mask contains every flag of at least one of its flag sets.
+_CRASH_RULES = (
+    ((_FLAGS['java.lang'], _FLAGS['exception']), 'java_exception', 'high', 0.92),
+    ((_FLAGS['fatal signal'], _FLAGS['sigsegv']), 'native_crash', 'critical', 0.95),
+    ((_FLAGS['anr'],), 'anr', 'high', 0.88),
+    ((_FLAGS['outofmemoryerror'], _FLAGS['oom']), 'oom', 'medium', 0.85),
+    ((_FLAGS['system'] | _FLAGS['crash'],), 'system_crash', 'critical', 0.90),
+)
+_UNKNOWN_CRASH = ((), 'unknown', 'medium', 0.60)
+
+
+def _keyword_mask(text: str) -> int:
+    """Return the OR of the flags of every keyword found in a line"""
+    mask = 0
+    for match in _KEYWORD_RE.finditer(text):
+        mask |= _KEYWORD_MASKS[match.group().lower()]
+    return mask
+
+
+def _keyword_masks(lines: List[str]) -> List[int]:
+    """
+    Return _keyword_mask for every line, scanning large batches in parallel
+    """
+    if len(lines) < _PARALLEL_MIN_LINES or (os.cpu_count() or 1) < 2:
+        return _scan_keyword_masks(lines)
+    
+    chunks = [
+        lines[i:i + _PARALLEL_CHUNK_LINES]
+        for i in range(0, len(lines), _PARALLEL_CHUNK_LINES)
+    ]
+    with ProcessPoolExecutor() as pool:
+        return list(chain.from_iterable(pool.map(_scan_keyword_masks, chunks)))
+
+
+def _scan_keyword_masks(lines: List[str]) -> List[int]:
+    """
+    Return _keyword_mask for every line using one scan over the joined text
+
+    The regex engine walks the whole batch in C; Python only runs per keyword
+    hit, mapping its offset back to a line. No keyword contains a newline,
+    so matches never straddle two lines.
+    """
+    masks = [0] * len(lines)
+    if not lines:
+        return masks
+    
+    starts = [0]
+    starts.extend(accumulate(len(line) + 1 for line in lines[:-1]))
+    for match in _KEYWORD_RE.finditer('\n'.join(lines)):
+        masks[bisect_right(starts, match.start()) - 1] |= _KEYWORD_MASKS[match.group().lower()]
+    return masks
+
+
+def _tail(line: str) -> str:
+    """Return the last whitespace-separated token of a line (or the line if blank)"""
+    parts = line.rsplit(None, 1)
+    return parts[-1] if parts else line
+
+
+@dataclass(frozen=True)
+class LogBatch:
+    """Log lines plus the per-line data the mock models derive from them"""
+    lines: Tuple[str, ...]
+    masks: Tuple[int, ...]
+    tails: Tuple[str, ...]
+    
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], masks: Optional[Iterable[int]] = None) -> 'LogBatch':
+        """Scan and tokenize the lines once for all models (masks: precomputed _keyword_mask per line)"""
+        lines = list(lines)
+        masks = _keyword_masks(lines) if masks is None else masks
+        return cls(tuple(lines), tuple(masks), tuple(map(_tail, lines)))
+
+
+def _as_log_batch(log_lines: Union[List[str], LogBatch], masks: Optional[Iterable[int]] = None) -> LogBatch:
+    """Return log_lines as a LogBatch, building one if given plain lines"""
+    if isinstance(log_lines, LogBatch):
+        return log_lines
+    return LogBatch.from_lines(log_lines, masks)
+
+
 class MockCrashClassifier:
     """Mock crash classifier for demonstration"""
     
@@ -24,172 +207,283 @@ class MockCrashClassifier:
         self.crash_types = ['java_exception', 'native_crash', 'anr', 'oom', 'system_crash']
         self.severities = ['critical', 'high', 'medium', 'low']
     
-    def classify_crash(self, log_text: str):
-        """Mock crash classification"""
+    def classify_crash(self, log_text: str, mask: Optional[int] = None):
+        """Mock crash classification (mask: precomputed _keyword_mask of log_text)"""
         # Simple rule-based classification for demo
-        text_lower = log_text.lower()
+        if mask is None:
+            mask = _keyword_mask(log_text)
         
-        if 'java.lang' in text_lower or 'exception' in text_lower:
-            crash_type = 'java_exception'
-            severity = 'high'
-            confidence = 0.92
-        elif 'fatal signal' in text_lower or 'sigsegv' in text_lower:
-            crash_type = 'native_crash'
-            severity = 'critical'
-            confidence = 0.95
-        elif 'anr' in text_lower:
-            crash_type = 'anr'
-            severity = 'high'
-            confidence = 0.88
-        elif 'outofmemoryerror' in text_lower or 'oom' in text_lower:
-            crash_type = 'oom'
-            severity = 'medium'
-            confidence = 0.85
-        elif 'system' in text_lower and 'crash' in text_lower:
-            crash_type = 'system_crash'
-            severity = 'critical'
-            confidence = 0.90
-        else:
-            crash_type = 'unknown'
-            severity = 'medium'
-            confidence = 0.60
-        
-        return MockCrashPrediction(
-            crash_type=crash_type,
-            confidence=confidence,
-            severity=severity,
-            description=f"Mock classification: {crash_type}",
-            recommendations=[f"Mock recommendation for {crash_type}"]
-        )
+        for flag_sets, crash_type, _, _ in _CRASH_RULES:
+            if any(mask & flags == flags for flags in flag_sets):
+                return _PREDICTIONS[crash_type]
+        return _PREDICTIONS['unknown']
 
 
+@dataclass(frozen=True)
 class MockCrashPrediction:
     """Mock crash prediction result"""
-    def __init__(self, crash_type, confidence, severity, description, recommendations):
-        self.crash_type = crash_type
-        self.confidence = confidence
-        self.severity = severity
-        self.description = description
-        self.recommendations = recommendations
+    __slots__ = ('crash_type', 'confidence', 'severity', 'description', 'recommendations')
+    
+    crash_type: str
+    confidence: float
+    severity: str
+    description: str
+    recommendations: Tuple[str, ...]
+
+
+# Predictions depend only on the crash type and are immutable, so
+# classify_crash hands out one shared instance per type
+_PREDICTIONS = {
+    crash_type: MockCrashPrediction(
+        crash_type=crash_type,
+        confidence=confidence,
+        severity=severity,
+        description=f"Mock classification: {crash_type}",
+        recommendations=(f"Mock recommendation for {crash_type}",)
+    )
+    for _, crash_type, severity, confidence in _CRASH_RULES + (_UNKNOWN_CRASH,)
+}
 
 
 class MockAnomalyDetector:
     """Mock anomaly detector for demonstration"""
     
-    def detect_anomalies(self, log_lines: List[str]):
-        """Mock anomaly detection"""
-        anomalies = []
+    # Distinct line tails tracked by update() at once; past this the rarest
+    # half is dropped, so only tails that keep repeating survive (counts of
+    # dropped tails restart if they come back, which can only undercount)
+    MAX_TRACKED_TAILS = 10_000
+    
+    def __init__(self):
+        # Running statistics kept by update()
+        self._line_total = 0
+        self._error_count = 0
+        self._line_counts = Counter()
+    
+    def update(self, batch: LogBatch):
+        """Add one LogBatch of a longer stream to the running statistics"""
+        self._line_total += len(batch.lines)
+        self._error_count += self._count_lines(batch, self._line_counts)
+        if len(self._line_counts) > self.MAX_TRACKED_TAILS:
+            self._line_counts = Counter(dict(
+                self._line_counts.most_common(self.MAX_TRACKED_TAILS // 2)
+            ))
+    
+    def finalize(self) -> List['MockAnomalyResult']:
+        """Return the anomalies of every batch passed to update() so far"""
+        return list(self._build_anomalies(
+            self._line_total, self._error_count, self._line_counts
+        ))
+    
+    def detect_anomalies(
+        self, log_lines: Union[List[str], LogBatch], masks: Optional[Iterable[int]] = None
+    ) -> Iterator['MockAnomalyResult']:
+        """
+        Mock anomaly detection, yielding results lazily
         
-        # Count error patterns
-        error_count = sum(1 for line in log_lines if 'error' in line.lower() or 'exception' in line.lower())
+        Accepts a prebuilt LogBatch, or plain lines with optional precomputed
+        _keyword_mask values (masks).
+        """
+        batch = _as_log_batch(log_lines, masks)
+        line_counts = Counter()
+        error_count = self._count_lines(batch, line_counts)
+        
+        yield from self._build_anomalies(len(batch.lines), error_count, line_counts)
+    
+    @staticmethod
+    def _count_lines(batch: LogBatch, line_counts: Counter) -> int:
+        """Add a batch's line tails to line_counts and return its error line count"""
+        # Count error lines and repeated line tails in a single pass over the
+        # batch's mask and tail columns
+        error_count = 0
+        error_flags = _ERROR_FLAGS  # local lookup in the per-line loop
+        for mask, tail in zip(batch.masks, batch.tails):
+            if mask & error_flags:
+                error_count += 1
+            line_counts[tail] += 1
+        return error_count
+    
+    def _build_anomalies(
+        self, line_total: int, error_count: int, line_counts: Dict[str, int]
+    ) -> Iterator['MockAnomalyResult']:
+        """Turn accumulated line statistics into anomaly results"""
+        # Scores are fractions of the batch; multiply by one hoisted reciprocal
+        inv_total = 1.0 / line_total if line_total else 0.0
         
         if error_count > 3:
-            anomalies.append(MockAnomalyResult(
+            yield MockAnomalyResult(
                 is_anomaly=True,
-                anomaly_score=error_count / len(log_lines),
+                anomaly_score=error_count * inv_total,
                 anomaly_type='high_error_rate',
-                description=f'High error rate detected: {error_count} errors in {len(log_lines)} lines',
+                description=f'High error rate detected: {error_count} errors in {line_total} lines',
                 severity='high',
-                recommendations=['Investigate error patterns', 'Check system stability']
-            ))
+                recommendations=('Investigate error patterns', 'Check system stability')
+            )
         
         # Check for repeated patterns
-        line_counts = {}
-        for line in log_lines:
-            # Normalize line
-            normalized = line.split()[-1] if line.split() else line
-            line_counts[normalized] = line_counts.get(normalized, 0) + 1
-        
         for pattern, count in line_counts.items():
             if count > 2:
-                anomalies.append(MockAnomalyResult(
+                yield MockAnomalyResult(
                     is_anomaly=True,
-                    anomaly_score=count / len(log_lines),
+                    anomaly_score=count * inv_total,
                     anomaly_type='repeated_pattern',
                     description=f'Repeated pattern detected: "{pattern}" appears {count} times',
                     severity='medium',
-                    recommendations=['Review pattern cause', 'Consider log optimization']
-                ))
-        
-        return anomalies
+                    recommendations=('Review pattern cause', 'Consider log optimization')
+                )
 
 
+@dataclass(frozen=True)
 class MockAnomalyResult:
     """Mock anomaly result"""
-    def __init__(self, is_anomaly, anomaly_score, anomaly_type, description, severity, recommendations):
-        self.is_anomaly = is_anomaly
-        self.anomaly_score = anomaly_score
-        self.anomaly_type = anomaly_type
-        self.description = description
-        self.severity = severity
-        self.recommendations = recommendations
+    __slots__ = ('is_anomaly', 'anomaly_score', 'anomaly_type', 'description', 'severity',
+                 'recommendations')
+    
+    is_anomaly: bool
+    anomaly_score: float
+    anomaly_type: str
+    description: str
+    severity: str
+    recommendations: Tuple[str, ...]
 
 
 class MockPatternRecognizer:
     """Mock pattern recognizer for demonstration"""
     
-    def recognize_patterns(self, log_lines: List[str]):
-        """Mock pattern recognition"""
-        patterns = []
-        
-        # Look for crash sequences
-        crash_lines = [line for line in log_lines if 'exception' in line.lower() or 'fatal' in line.lower()]
-        if len(crash_lines) >= 2:
-            patterns.append(MockPattern(
-                pattern_id='crash_sequence_001',
-                pattern_type='template',
-                description='Application crash sequence detected',
-                frequency=len(crash_lines),
-                confidence=0.9,
-                severity='critical',
-                examples=crash_lines[:3],
-                recommendations=['Analyze crash stack trace', 'Fix null pointer exceptions']
-            ))
-        
-        # Look for memory patterns
-        memory_lines = [line for line in log_lines if 'memory' in line.lower() or 'oom' in line.lower()]
-        if len(memory_lines) >= 2:
-            patterns.append(MockPattern(
-                pattern_id='memory_pattern_001',
-                pattern_type='frequency',
-                description='Memory pressure indicators',
-                frequency=len(memory_lines),
-                confidence=0.8,
-                severity='high',
-                examples=memory_lines[:3],
-                recommendations=['Monitor memory usage', 'Optimize allocations']
-            ))
+    # Example lines kept per pattern
+    MAX_EXAMPLES = 3
+    
+    def __init__(self):
+        # Running counts and examples kept by update()
+        self._counts = [0] * len(_PATTERN_BUCKETS)
+        self._examples = [[] for _ in _PATTERN_BUCKETS]
+    
+    def update(self, batch: LogBatch):
+        """Add one LogBatch of a longer stream to the running counts and examples"""
+        self._count_patterns(batch, self._counts, self._examples)
+    
+    def finalize(self) -> List['MockPattern']:
+        """Return the patterns of every batch passed to update() so far"""
+        return list(self._build_patterns(self._counts, self._examples))
+    
+    def recognize_patterns(
+        self, log_lines: Union[List[str], LogBatch], masks: Optional[Iterable[int]] = None
+    ) -> Iterator['MockPattern']:
+        """
+        Mock pattern recognition, yielding results lazily
         
-        # Look for performance patterns
-        perf_lines = [line for line in log_lines if 'slow' in line.lower() or 'timeout' in line.lower() or 'blocked' in line.lower()]
-        if len(perf_lines) >= 2:
-            patterns.append(MockPattern(
-                pattern_id='performance_pattern_001',
-                pattern_type='ml_cluster',
-                description='Performance degradation signs',
-                frequency=len(perf_lines),
-                confidence=0.75,
-                severity='medium',
-                examples=perf_lines[:3],
-                recommendations=['Profile performance', 'Optimize slow operations']
-            ))
+        Accepts a prebuilt LogBatch, or plain lines with optional precomputed
+        _keyword_mask values (masks).
+        """
+        batch = _as_log_batch(log_lines, masks)
+        counts = [0] * len(_PATTERN_BUCKETS)
+        examples = [[] for _ in _PATTERN_BUCKETS]
+        self._count_patterns(batch, counts, examples)
         
-        return patterns
+        yield from self._build_patterns(counts, examples)
+    
+    def _count_patterns(self, batch: LogBatch, counts: List[int], examples: List[List[str]]):
+        """Add a batch's crash, memory and performance lines to counts and examples"""
+        # Count every bucket in one pass, keeping only the first few lines of
+        # each as examples
+        max_examples = self.MAX_EXAMPLES
+        for line, mask in zip(batch.lines, batch.masks):
+            for index, flags in enumerate(_BUCKET_FLAGS):
+                if mask & flags:
+                    counts[index] += 1
+                    if counts[index] <= max_examples:
+                        examples[index].append(line)
+    
+    def _build_patterns(
+        self, counts: List[int], examples: List[List[str]]
+    ) -> Iterator['MockPattern']:
+        """Turn per-bucket line counts and examples into pattern results"""
+        for bucket, count, bucket_examples in zip(_PATTERN_BUCKETS, counts, examples):
+            _, pattern_id, pattern_type, description, confidence, severity, recommendations = bucket
+            if count >= 2:
+                yield MockPattern(
+                    pattern_id=pattern_id,
+                    pattern_type=pattern_type,
+                    description=description,
+                    frequency=count,
+                    confidence=confidence,
+                    severity=severity,
+                    examples=tuple(bucket_examples),
+                    recommendations=recommendations
+                )
 
 
+@dataclass(frozen=True)
 class MockPattern:
     """Mock pattern result"""
-    def __init__(self, pattern_id, pattern_type, description, frequency, confidence, severity, examples, recommendations):
-        self.pattern_id = pattern_id
-        self.pattern_type = pattern_type
-        self.description = description
-        self.frequency = frequency
-        self.confidence = confidence
-        self.severity = severity
-        self.examples = examples
-        self.recommendations = recommendations
+    __slots__ = ('pattern_id', 'pattern_type', 'description', 'frequency', 'confidence',
+                 'severity', 'examples', 'recommendations')
+    
+    pattern_id: str
+    pattern_type: str
+    description: str
+    frequency: int
+    confidence: float
+    severity: str
+    examples: Tuple[str, ...]
+    recommendations: Tuple[str, ...]
+
+
+class LogPipeline:
+    """
+    Streams log lines through all three mock models in a single pass
+    
+    Fed lines are collected into LogBatch chunks of BATCH_LINES and passed
+    to each model's update(); finalize() collects their results. Crash
+    classifications are counted per prediction rather than kept per line,
+    so memory is bounded by one chunk, the tracked line tails and a few
+    example lines rather than by the size of the log.
+    """
+    
+    BATCH_LINES = 4_096
+    
+    def __init__(self, classifier=None, detector=None, recognizer=None):
+        self.classifier = classifier or MockCrashClassifier()
+        self.detector = detector or MockAnomalyDetector()
+        self.recognizer = recognizer or MockPatternRecognizer()
+        
+        self.line_total = 0
+        self.crash_counts = Counter()
+        self._pending = []
+    
+    def feed(self, line: str):
+        """Queue one log line, updating every model's state once a chunk is full"""
+        pending = self._pending
+        pending.append(line.rstrip('\n'))
+        if len(pending) >= self.BATCH_LINES:
+            self._flush()
+    
+    def _flush(self):
+        """Run the queued lines through every model as one LogBatch"""
+        if not self._pending:
+            return
+        batch = LogBatch.from_lines(self._pending)
+        self._pending = []
+        
+        self.line_total += len(batch.lines)
+        self.detector.update(batch)
+        self.recognizer.update(batch)
+        
+        # Predictions are shared per crash type, so counting them keeps every
+        # classification at constant memory
+        classify = self.classifier.classify_crash
+        self.crash_counts.update(
+            classify(line, mask)
+            for line, mask in zip(batch.lines, batch.masks)
+            if mask & _CRASH_LINE_FLAGS
+        )
+    
+    def finalize(self):
+        """Return (crash prediction counts, anomalies, patterns) for the fed lines"""
+        self._flush()
+        return self.crash_counts, self.detector.finalize(), self.recognizer.finalize()
 
 
+@buffered_output
 def demo_mock_ml_capabilities():
     """Demonstrate mock ML capabilities"""
     print("🧠 Mock ML Capabilities Demo")
@@ -213,6 +507,7 @@ def demo_mock_ml_capabilities():
     return True
 
 
+@buffered_output
 def demo_mock_crash_classifier():
     """Demonstrate mock crash classification"""
     print("\n\n🔥 Mock Crash Classifier Demo")
@@ -230,8 +525,9 @@ def demo_mock_crash_classifier():
     
     print(f"🔍 Analyzing {len(test_crashes)} crash samples:")
     
+    classify = classifier.classify_crash
     for i, crash_text in enumerate(test_crashes, 1):
-        prediction = classifier.classify_crash(crash_text)
+        prediction = classify(crash_text)
         
         print(f"\n{i}. Crash: {crash_text[:60]}...")
         print(f"   Type: {prediction.crash_type}")
@@ -246,6 +542,7 @@ def demo_mock_crash_classifier():
     print(f"   Supported Types: {', '.join(classifier.crash_types)}")
 
 
+@buffered_output
 def demo_mock_anomaly_detector():
     """Demonstrate mock anomaly detection"""
     print("\n\n🚨 Mock Anomaly Detector Demo")
@@ -268,7 +565,7 @@ def demo_mock_anomaly_detector():
     
     print(f"🔍 Analyzing {len(sample_logs)} log lines for anomalies:")
     
-    anomalies = detector.detect_anomalies(sample_logs)
+    anomalies = list(detector.detect_anomalies(sample_logs))
     
     print(f"\n📊 Mock Anomaly Detection Results:")
     print(f"   Total anomalies detected: {len(anomalies)}")
@@ -286,6 +583,7 @@ def demo_mock_anomaly_detector():
     print(f"   Supported Patterns: high_error_rate, repeated_pattern, log_volume_spike")
 
 
+@buffered_output
 def demo_mock_pattern_recognizer():
     """Demonstrate mock pattern recognition"""
     print("\n\n🔍 Mock Pattern Recognizer Demo")
@@ -309,7 +607,7 @@ def demo_mock_pattern_recognizer():
     
     print(f"🔍 Analyzing {len(sample_logs)} log lines for patterns:")
     
-    patterns = recognizer.recognize_patterns(sample_logs)
+    patterns = list(recognizer.recognize_patterns(sample_logs))
     
     print(f"\n📊 Mock Pattern Recognition Results:")
     print(f"   Total patterns detected: {len(patterns)}")
@@ -330,6 +628,7 @@ def demo_mock_pattern_recognizer():
         print(f"   Average confidence: {sum(p.confidence for p in patterns) / len(patterns):.2f}")
 
 
+@buffered_output
 def demo_mock_ml_integration():
     """Demonstrate mock ML integration workflow"""
     print("\n\n🚀 Mock ML Integration Demo")
@@ -351,44 +650,35 @@ def demo_mock_ml_integration():
 01-01 10:00:09.012  7890  7890 W Performance: Slow operation detected: 2500ms
 '''
     
-    log_lines = comprehensive_log.strip().split('\n')
-    
     print("🔍 Performing mock ML-enhanced analysis...")
     
-    # Mock analysis results
-    classifier = MockCrashClassifier()
-    detector = MockAnomalyDetector()
-    recognizer = MockPatternRecognizer()
-    
-    # Classify crashes
-    crash_lines = [line for line in log_lines if 'exception' in line.lower() or 'fatal' in line.lower() or 'sigsegv' in line.lower()]
-    crash_classifications = []
-    for crash_line in crash_lines:
-        prediction = classifier.classify_crash(crash_line)
-        crash_classifications.append(prediction)
-    
-    # Detect anomalies
-    anomalies = detector.detect_anomalies(log_lines)
-    
-    # Recognize patterns
-    patterns = recognizer.recognize_patterns(log_lines)
+    # Stream the log through all three mock models in a single pass
+    pipeline = LogPipeline()
+    feed = pipeline.feed
+    for line in io.StringIO(comprehensive_log.strip()):
+        feed(line)
+    crash_counts, anomalies, patterns = pipeline.finalize()
+    crash_total = sum(crash_counts.values())
     
     print(f"\n📊 Mock Analysis Results:")
-    print(f"   Total log lines: {len(log_lines)}")
-    print(f"   ML crashes classified: {len(crash_classifications)}")
+    print(f"   Total log lines: {pipeline.line_total}")
+    print(f"   ML crashes classified: {crash_total}")
     print(f"   Anomalies detected: {len(anomalies)}")
     print(f"   Patterns recognized: {len(patterns)}")
     
     # Calculate mock health score
-    total_issues = len(crash_classifications) + len(anomalies) + len(patterns)
-    critical_issues = sum(1 for c in crash_classifications if c.severity == 'critical')
+    total_issues = crash_total + len(anomalies) + len(patterns)
+    critical_issues = sum(
+        count for prediction, count in crash_counts.items() if prediction.severity == 'critical'
+    )
     health_score = max(0, 100 - (critical_issues * 20) - (total_issues * 5))
     
     print(f"   System health score: {health_score}/100")
     
-    if crash_classifications:
-        most_common_type = max(set(c.crash_type for c in crash_classifications), 
-                              key=[c.crash_type for c in crash_classifications].count)
+    if crash_counts:
+        # One prediction per crash type, so the most common prediction is
+        # also the most common type
+        most_common_type = crash_counts.most_common(1)[0][0].crash_type
         print(f"   Most common crash type: {most_common_type}")
         print(f"   Critical crashes: {critical_issues}")
     
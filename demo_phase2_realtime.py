@@ -9,9 +9,14 @@ This script demonstrates the successful implementation of Phase 2 real-time feat
 - Complete monitoring system integration
 """
 
+import re
 import sys
 import time
 import threading
+import dataclasses
+from collections import Counter, deque
+from itertools import cycle, islice
+from datetime import datetime
 from pathlib import Path
 
 # Add current directory to path
@@ -23,12 +28,139 @@ try:
         check_streaming_health, demo_streaming_features,
         ADBLogCollector, MockADBCollector, StreamProcessor, AlertManager
     )
-    from android_log_analyzer.streaming.processors.stream_processor import AlertLevel
+    from android_log_analyzer.streaming.collectors.adb_collector import LogEntry
+    from android_log_analyzer.streaming.processors.stream_processor import Alert, AlertLevel
     STREAMING_IMPORT_SUCCESS = True
 except ImportError as e:
     print(f"⚠️  Streaming features not available: {e}")
     STREAMING_IMPORT_SUCCESS = False
 
+# Alert level markers and the alert line template, built once instead of
+# on every alert callback
+_LEVEL_EMOJI = {
+    AlertLevel.CRITICAL: "🚨",
+    AlertLevel.ERROR: "❌",
+    AlertLevel.WARNING: "⚠️",
+    AlertLevel.INFO: "ℹ️"
+} if STREAMING_IMPORT_SUCCESS else {}
+_ALERT_FMT = "{} ALERT: {}\n   Description: {}\n".format
+
+# Test log entries and alerts for the processor and alert manager demos.
+# Built once; each demo run stamps them with the current time via
+# dataclasses.replace
+if STREAMING_IMPORT_SUCCESS:
+    _TEMPLATE_LOGS = (
+        LogEntry(
+            timestamp=None,
+            pid=1234, tid=1234, level="E", tag="AndroidRuntime",
+            message="FATAL EXCEPTION: main java.lang.NullPointerException",
+            raw_line="test", device_id="demo"
+        ),
+        LogEntry(
+            timestamp=None,
+            pid=5678, tid=5678, level="I", tag="ActivityManager",
+            message="ANR in com.example.app: Input dispatching timed out",
+            raw_line="test", device_id="demo"
+        ),
+        LogEntry(
+            timestamp=None,
+            pid=9999, tid=9999, level="E", tag="System",
+            message="OutOfMemoryError: Failed to allocate 8MB",
+            raw_line="test", device_id="demo"
+        )
+    )
+    _TEMPLATE_ALERTS = (
+        Alert(
+            id="test_critical_001",
+            level=AlertLevel.CRITICAL,
+            title="Application Crash Detected",
+            description="Fatal exception in main thread",
+            timestamp=None,
+            source="demo",
+            metadata={"crash_type": "java_exception"}
+        ),
+        Alert(
+            id="test_error_001",
+            level=AlertLevel.ERROR,
+            title="ANR Detected",
+            description="Application not responding",
+            timestamp=None,
+            source="demo",
+            metadata={"anr_type": "input_timeout"}
+        ),
+        Alert(
+            id="test_warning_001",
+            level=AlertLevel.WARNING,
+            title="High Memory Usage",
+            description="Memory usage above threshold",
+            timestamp=None,
+            source="demo",
+            metadata={"memory_usage": "85%"}
+        )
+    )
+else:
+    _TEMPLATE_LOGS = _TEMPLATE_ALERTS = ()
+
+
+# Message prefixes the bulk replay counts itself; only entries matching
+# none of them are handed to StreamProcessor.process_log
+_FAST_PATH_PREFIXES = ("FATAL EXCEPTION", "ANR in", "OutOfMemoryError")
+_FAST_PATH_RE = re.compile(
+    "^(?:" + "|".join(map(re.escape, _FAST_PATH_PREFIXES)) + ")", re.MULTILINE
+)
+
+
+def _trunc(s, n):
+    """Return s cut to n characters, skipping the slice for short strings"""
+    return s if len(s) <= n else s[:n]
+
+
+# Callback output from the collector and processor threads is queued and
+# written in batches, once _OUT_FLUSH_CHARS are pending or every
+# _OUT_FLUSH_INTERVAL seconds, instead of one print() per event
+_OUT_FLUSH_CHARS = 64 * 1024
+_OUT_FLUSH_INTERVAL = 0.1
+
+_out_parts = []
+_out_size = 0
+_out_lock = threading.Lock()
+_out_flusher = None
+
+
+def _emit(text):
+    """Queue callback output for the next batched write"""
+    global _out_size, _out_flusher
+    with _out_lock:
+        _out_parts.append(text)
+        _out_size += len(text)
+        if _out_flusher is None:
+            _out_flusher = threading.Thread(target=_flush_periodically, daemon=True)
+            _out_flusher.start()
+        full = _out_size >= _OUT_FLUSH_CHARS
+    if full:
+        _flush()
+
+
+def _flush():
+    """Write all queued callback output to stdout"""
+    global _out_size
+    with _out_lock:
+        if not _out_parts:
+            return
+        text = "".join(_out_parts)
+        _out_parts.clear()
+        _out_size = 0
+        # Write under the lock so concurrent flushes keep their order
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _flush_periodically():
+    """Flush queued output on a timer so low-rate output still appears"""
+    while True:
+        time.sleep(_OUT_FLUSH_INTERVAL)
+        _flush()
+
 
 def demo_streaming_capabilities():
     """Demonstrate streaming capabilities and status"""
@@ -115,12 +247,16 @@ def demo_log_collector():
         
         print("🔍 Starting mock log collection...")
         
-        # Collect some logs
-        logs_collected = []
+        # Collect some logs, stopping as soon as enough have arrived
+        logs_collected = deque(maxlen=5000)  # bounded however long it runs
+        target_logs = 2
+        done = threading.Event()
         
         def log_callback(log_entry):
             logs_collected.append(log_entry)
-            print(f"📝 [{log_entry.level}] {log_entry.tag}: {log_entry.message[:50]}...")
+            if len(logs_collected) >= target_logs:
+                done.set()
+            _emit(f"📝 [{log_entry.level}] {log_entry.tag}: {_trunc(log_entry.message, 50)}...\n")
         
         collector.add_callback(log_callback)
         
@@ -128,11 +264,12 @@ def demo_log_collector():
         if collector.start():
             print("✅ Collector started successfully")
             
-            # Collect for a few seconds
-            time.sleep(3)
+            # Collect for at most a few seconds
+            done.wait(timeout=3)
             
             # Stop collection
             collector.stop()
+            _flush()
             print("🛑 Collector stopped")
             
             # Show stats
@@ -140,7 +277,8 @@ def demo_log_collector():
             print(f"\n📊 Collection Statistics:")
             print(f"   Total logs: {len(logs_collected)}")
             print(f"   Parsed lines: {stats['parsed_lines']}")
-            print(f"   Uptime: {stats.get('uptime', 0):.1f} seconds")
+            uptime = stats.get('uptime', 0)
+            print(f"   Uptime: {uptime:.1f} seconds")
             
         else:
             print("❌ Failed to start collector")
@@ -164,62 +302,47 @@ def demo_stream_processor():
         print("🔍 Starting stream processor...")
         
         # Collect alerts
-        alerts_generated = []
+        alerts_generated = deque(maxlen=5000)  # bounded however long it runs
         
-        def alert_callback(alert):
+        # Module-level lookups are bound as defaults so each call reads locals
+        def alert_callback(alert, _lvl=_LEVEL_EMOJI, _get=dict.get,
+                           _fmt=_ALERT_FMT, _out=_emit):
             alerts_generated.append(alert)
-            level_emoji = {
-                AlertLevel.CRITICAL: "🚨",
-                AlertLevel.ERROR: "❌", 
-                AlertLevel.WARNING: "⚠️",
-                AlertLevel.INFO: "ℹ️"
-            }
-            emoji = level_emoji.get(alert.level, "📢")
-            print(f"{emoji} ALERT: {alert.title}")
-            print(f"   Description: {alert.description}")
+            emoji = _get(_lvl, alert.level, "📢")
+            _out(_fmt(emoji, alert.title, alert.description))
         
         processor.add_alert_callback(alert_callback)
         
+        # Signalled once every test log has been processed (alerts are
+        # raised before analysis callbacks run)
+        done = threading.Event()
+        expected_logs = len(_TEMPLATE_LOGS)
+        
+        def analysis_callback(analysis):
+            if processor.get_metrics().total_logs >= expected_logs:
+                done.set()
+        
+        processor.add_analysis_callback(analysis_callback)
+        
         # Start processor
         if processor.start():
             print("✅ Processor started successfully")
             
             # Simulate some log entries that should trigger alerts
-            from android_log_analyzer.streaming.collectors.adb_collector import LogEntry
-            from datetime import datetime
+            now = datetime.now()
+            test_logs = [dataclasses.replace(t, timestamp=now) for t in _TEMPLATE_LOGS]
             
-            # Create test log entries
-            test_logs = [
-                LogEntry(
-                    timestamp=datetime.now(),
-                    pid=1234, tid=1234, level="E", tag="AndroidRuntime",
-                    message="FATAL EXCEPTION: main java.lang.NullPointerException",
-                    raw_line="test", device_id="demo"
-                ),
-                LogEntry(
-                    timestamp=datetime.now(),
-                    pid=5678, tid=5678, level="I", tag="ActivityManager",
-                    message="ANR in com.example.app: Input dispatching timed out",
-                    raw_line="test", device_id="demo"
-                ),
-                LogEntry(
-                    timestamp=datetime.now(),
-                    pid=9999, tid=9999, level="E", tag="System",
-                    message="OutOfMemoryError: Failed to allocate 8MB",
-                    raw_line="test", device_id="demo"
-                )
-            ]
-            
-            # Process test logs
+            # Process test logs; the processor queues them in order, and
+            # buffered alert output no longer needs spacing between entries
             for log_entry in test_logs:
                 processor.process_log(log_entry)
-                time.sleep(0.5)  # Small delay between logs
             
             # Wait for processing
-            time.sleep(2)
+            done.wait(timeout=2)
             
             # Stop processor
             processor.stop()
+            _flush()
             print("🛑 Processor stopped")
             
             # Show results
@@ -238,6 +361,49 @@ def demo_stream_processor():
         print(f"❌ Processor demo failed: {e}")
 
 
+def demo_stream_processor_bulk(n=100000):
+    """Replay the template logs n times as a throughput check
+
+    Crash, ANR and OOM prefixes are counted in one regex pass over the
+    joined messages, without building a LogEntry per row; only the
+    remaining entries go through the real processor.
+    """
+    print("\n\n⚡ Bulk Stream Replay Demo")
+    print("=" * 50)
+    
+    if not STREAMING_IMPORT_SUCCESS:
+        print("❌ Stream processor not available")
+        return
+    
+    try:
+        start = time.perf_counter()
+        rows = list(islice(cycle(_TEMPLATE_LOGS), n))
+        counts = Counter(_FAST_PATH_RE.findall(
+            "\n".join([entry.message for entry in rows])
+        ))
+        slow = [entry for entry in rows
+                if not entry.message.startswith(_FAST_PATH_PREFIXES)]
+        
+        if slow:
+            processor = StreamProcessor()
+            if processor.start():
+                now = datetime.now()
+                for entry in slow:
+                    processor.process_log(dataclasses.replace(entry, timestamp=now))
+                processor.stop()
+            else:
+                print("❌ Failed to start processor")
+        
+        elapsed = time.perf_counter() - start
+        print(f"📊 Replayed {n} logs in {elapsed:.3f} seconds")
+        for prefix in _FAST_PATH_PREFIXES:
+            print(f"   {prefix}: {counts.get(prefix, 0)}")
+        print(f"   Sent to processor: {len(slow)}")
+        
+    except Exception as e:
+        print(f"❌ Bulk replay failed: {e}")
+
+
 def demo_alert_manager():
     """Demonstrate alert management capabilities"""
     print("\n\n🚨 Alert Manager Demo")
@@ -253,38 +419,8 @@ def demo_alert_manager():
         print("🔍 Testing alert management...")
         
         # Create test alerts
-        from android_log_analyzer.streaming.processors.stream_processor import Alert
-        from datetime import datetime
-        
-        test_alerts = [
-            Alert(
-                id="test_critical_001",
-                level=AlertLevel.CRITICAL,
-                title="Application Crash Detected",
-                description="Fatal exception in main thread",
-                timestamp=datetime.now(),
-                source="demo",
-                metadata={"crash_type": "java_exception"}
-            ),
-            Alert(
-                id="test_error_001", 
-                level=AlertLevel.ERROR,
-                title="ANR Detected",
-                description="Application not responding",
-                timestamp=datetime.now(),
-                source="demo",
-                metadata={"anr_type": "input_timeout"}
-            ),
-            Alert(
-                id="test_warning_001",
-                level=AlertLevel.WARNING,
-                title="High Memory Usage",
-                description="Memory usage above threshold",
-                timestamp=datetime.now(),
-                source="demo",
-                metadata={"memory_usage": "85%"}
-            )
-        ]
+        now = datetime.now()
+        test_alerts = [dataclasses.replace(t, timestamp=now) for t in _TEMPLATE_ALERTS]
         
         # Process alerts
         for alert in test_alerts:
@@ -317,19 +453,27 @@ def demo_complete_monitor():
         
         print("🔍 Starting complete monitoring system...")
         
-        # Add callbacks to see activity
+        # Add callbacks to see activity, stopping once enough logs arrived
+        logs_seen = 0
+        target_logs = 4
+        done = threading.Event()
+        
         def log_callback(log_data):
-            print(f"📝 Log: [{log_data['level']}] {log_data['tag']}: {log_data['message'][:40]}...")
+            nonlocal logs_seen
+            logs_seen += 1
+            if logs_seen >= target_logs:
+                done.set()
+            _emit(f"📝 Log: [{log_data['level']}] {log_data['tag']}: {_trunc(log_data['message'], 40)}...\n")
         
         def alert_callback(alert):
-            print(f"🚨 Alert: {alert.title} ({alert.level.value})")
+            _emit(f"🚨 Alert: {alert.title} ({alert.level.value})\n")
         
-        def metrics_callback(metrics):
-            collector_stats = metrics.get('collector_stats', {})
-            processor_metrics = metrics.get('processor_metrics', {})
-            print(f"📊 Metrics: {collector_stats.get('parsed_lines', 0)} logs, "
-                  f"{processor_metrics.get('total_logs', 0)} processed, "
-                  f"{processor_metrics.get('alerts_generated', 0)} alerts")
+        def metrics_callback(metrics, _get=dict.get, _out=_emit):
+            collector_stats = _get(metrics, 'collector_stats', {})
+            processor_metrics = _get(metrics, 'processor_metrics', {})
+            _out(f"📊 Metrics: {_get(collector_stats, 'parsed_lines', 0)} logs, "
+                 f"{_get(processor_metrics, 'total_logs', 0)} processed, "
+                 f"{_get(processor_metrics, 'alerts_generated', 0)} alerts\n")
         
         monitor.add_log_callback(log_callback)
         monitor.add_alert_callback(alert_callback)
@@ -340,8 +484,9 @@ def demo_complete_monitor():
             print("✅ Monitor started successfully")
             
             # Run for a few seconds
-            print("🔄 Monitoring for 5 seconds...")
-            time.sleep(5)
+            print("🔄 Monitoring for up to 5 seconds...")
+            done.wait(timeout=5)
+            _flush()
             
             # Get status
             status = monitor.get_status()
@@ -360,6 +505,7 @@ def demo_complete_monitor():
             
             # Stop monitoring
             monitor.stop()
+            _flush()
             print("🛑 Monitor stopped")
             
         else:
@@ -436,4 +582,7 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--bulk" in sys.argv[1:]:
+        demo_stream_processor_bulk()
+        sys.exit(0)
     sys.exit(main())
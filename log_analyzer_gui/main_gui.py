@@ -1,9 +1,27 @@
+import base64
 import eel
+import io
+import json
+import logging
 import os
-import time
+import re
+import shutil
 import tempfile # For saving content to a temporary file
 import sys
-import platform # To help determine executable name for Python
+import threading
+import time
+import uuid
+from enum import Enum
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; when installed it replaces json.dumps on the Eel bridge
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # --- Path adjustments for packaged app ---
 script_root_dir = os.path.dirname(os.path.realpath(__file__))
@@ -28,88 +46,209 @@ try:
     # Now, Python should be able to find the 'android_log_analyzer' package
     # (because 'android_log_analyzer/__init__.py' makes it a package, and it's a subdir)
     from android_log_analyzer.log_analyzer import read_log_file, get_structured_report_data, ISSUE_PATTERNS, smart_search_logs, prioritize_issues
-    from android_log_analyzer.advanced_parser import AdvancedLogParser
-    from android_log_analyzer.sprd_analyzer import SPRDLogAnalyzer
+    # log_analyzer has already tried the intelligent subpackage; reuse its
+    # result instead of importing the classes again here
+    from android_log_analyzer.log_analyzer import INTELLIGENT_FEATURES_AVAILABLE
     from pathlib import Path
+    from importlib.util import find_spec
 
-    # Try to import intelligent features
-    try:
-        from android_log_analyzer.intelligent.smart_search import SmartSearchEngine
-        from android_log_analyzer.intelligent.priority_scorer import IssuePriorityScorer
-        from android_log_analyzer.intelligent.report_generator import IntelligentReportGenerator
-        INTELLIGENT_FEATURES_AVAILABLE = True
-        print("Successfully imported 'log_analyzer' components, advanced analyzers, and intelligent features.")
-    except ImportError as ie:
-        INTELLIGENT_FEATURES_AVAILABLE = False
-        print(f"Intelligent features not available: {ie}")
-        print("Successfully imported 'log_analyzer' components and advanced analyzers.")
+    # The package analyzers are imported on first use in
+    # perform_advanced_analysis; only check here that they are installed
+    _HAS_ADVANCED = all(find_spec(name) is not None for name in (
+        "android_log_analyzer.advanced_parser",
+        "android_log_analyzer.sprd_analyzer",
+    ))
+
+    if INTELLIGENT_FEATURES_AVAILABLE:
+        print("Successfully imported 'log_analyzer' components and intelligent features.")
+    else:
+        print("Intelligent features not available.")
+        print("Successfully imported 'log_analyzer' components.")
 except ImportError as e:
     print(f"Error importing 'log_analyzer': {e}. Check paths and structure.")
     print(f"Current sys.path: {sys.path}")
     print(f"Expected module location: {os.path.join(base_path_for_module, 'android_log_analyzer')}")
-    # Define dummy functions if import fails, so UI can still be tested partially
-    def read_log_file(filepath, patterns): return [{"type": "ImportError", "trigger_line": str(e)}]
+    # Define dummy functions if import fails, so UI can still be tested partially.
+    # They read the message from a global: 'e' is unbound once this block ends,
+    # and holding the exception would keep its traceback frames alive.
+    _IMPORT_ERROR_MSG = str(e)
+    def read_log_file(filepath, patterns): return [{"type": "ImportError", "trigger_line": _IMPORT_ERROR_MSG}]
     def get_structured_report_data(issues): 
         return {
             "summary_counts": {"ImportError": 1}, 
-            "detailed_issues": [{"type": "ImportError", "trigger_line_str": f"Import Error: {e}. Check logs."}]
+            "detailed_issues": [{"type": "ImportError", "trigger_line_str": f"Import Error: {_IMPORT_ERROR_MSG}. Check logs."}]
         }
     ISSUE_PATTERNS = {}
+    _HAS_ADVANCED = False
+    INTELLIGENT_FEATURES_AVAILABLE = False
 # --- End of path addition ---
 
 
+# Uploads that need a real file are staged in a 'temp_files' subdir next to
+# this script, created once at startup; None falls back to the system temp dir
+_UPLOAD_PREFIX = "upload_"
+
+# Staged uploads older than this are left over from a run that did not exit
+# cleanly; younger ones may belong to another running instance
+_STALE_UPLOAD_AGE = 60 * 60  # seconds
+
+def _remove_stale_uploads(temp_dir, max_age=_STALE_UPLOAD_AGE):
+    """Delete staged uploads (and their extracted trees) not modified within max_age seconds"""
+    cutoff = time.time() - max_age
+    for entry in os.scandir(temp_dir):
+        if not entry.name.startswith(_UPLOAD_PREFIX):
+            continue
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+try:
+    _APP_TEMP_DIR = os.path.join(script_root_dir, "temp_files")
+    os.makedirs(_APP_TEMP_DIR, exist_ok=True)
+except OSError as e_custom_temp:
+    print(f"Could not use custom temp dir '{_APP_TEMP_DIR}': {e_custom_temp}. Falling back to default temp dir.")
+    _APP_TEMP_DIR = None
+
 web_folder = os.path.join(script_root_dir, 'web') # 'web' folder is sibling to main_gui.py in dev, and copied by 'files' in build
-eel.init(web_folder)
+
+# Base64 slice size for decoding archive uploads; a multiple of 4 so every
+# slice decodes on its own
+_B64_CHUNK_CHARS = 1 << 20
+
+# Staged uploads are written through a large buffer so the decoded slices
+# reach the disk as a few big sequential writes
+_UPLOAD_WRITE_BUFFER = 1 << 20
+
+class AnalyzerKind(Enum):
+    """Analyzer an upload is routed to, decided once from its filename"""
+    STANDARD = "standard"                # plain log, read_log_file
+    SPRD = "sprd"                        # SPRD/Unisoc ylog package, SPRDLogAnalyzer
+    GENERIC_ARCHIVE = "generic_archive"  # other archive or log package, AdvancedLogParser
+
+# Archive suffixes and vendor package keywords, matched in one case-insensitive pass
+_COMPLEX_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz')
+_SPRD_KEYWORDS = ('ylog', 'sprd', 'unisoc')
+_COMPLEX_KEYWORDS = _SPRD_KEYWORDS + ('log_package',)
+_COMPLEX_PKG_RE = re.compile(
+    r'(?:%s)\Z|%s' % ('|'.join(map(re.escape, _COMPLEX_SUFFIXES)), '|'.join(map(re.escape, _COMPLEX_KEYWORDS))),
+    re.IGNORECASE | re.ASCII)
+_SPRD_PKG_RE = re.compile('|'.join(map(re.escape, _SPRD_KEYWORDS)), re.IGNORECASE | re.ASCII)
+
+@lru_cache(maxsize=1024)
+def classify_log_package(filename):
+    """Return the AnalyzerKind for an uploaded file name"""
+    if _SPRD_PKG_RE.search(filename):
+        return AnalyzerKind.SPRD
+    if _COMPLEX_PKG_RE.search(filename):
+        return AnalyzerKind.GENERIC_ARCHIVE
+    return AnalyzerKind.STANDARD
 
 def is_complex_log_package(filename):
     """Check if the file is a complex log package (zip/tar) that needs advanced analysis"""
-    return (filename.lower().endswith(('.zip', '.tar', '.tar.gz', '.tgz')) or
-            'ylog' in filename.lower() or
-            any(keyword in filename.lower() for keyword in ['sprd', 'unisoc', 'log_package']))
+    return classify_log_package(filename) is not AnalyzerKind.STANDARD
+
+# Extensions script.js uploads as binary (BINARY_EXTENSIONS there); staged
+# uploads keep them so the analyzers can tell archives apart by suffix
+_BIN_EXTS = frozenset({'.zip', '.tar', '.gz', '.tgz'})
+
+def _upload_suffix(lower_name):
+    """Suffix for a staged upload: its archive extension, otherwise .log"""
+    ext = os.path.splitext(lower_name)[1]
+    return ext if ext in _BIN_EXTS else ".log"
 
 @eel.expose
 def start_analysis_py(filename, file_content_string):
+    """Analyze a text log upload; archives go through start_analysis_py_binary"""
     print(f"Python: Received file '{filename}'. Content length: {len(file_content_string)} bytes.")
 
+    lower_name = filename.lower()
+    kind = classify_log_package(lower_name)
+    complex_package = kind is not AnalyzerKind.STANDARD
+
+    # Empty drops are rejected before anything is written or scanned
+    if not complex_package and not file_content_string.strip():
+        return {"status": "error", "message": f"File '{filename}' is empty or contains only whitespace."}
+
+    if complex_package:
+        # Vendor packages are handed to the package analyzers as a file
+        return _analyze_upload_file(filename, kind, ".log", False,
+                                    lambda tmp_file: tmp_file.write(file_content_string),
+                                    file_content_string)
+
+    try:
+        # Plain text logs are analyzed straight from memory
+        print(f"Python: Using standard analysis")
+        return perform_standard_analysis(filename, io.StringIO(file_content_string), file_content_string)
+    except Exception as e:
+        print(f"Python: Error during analysis of {filename}: {e}")
+        import traceback
+        traceback.print_exc()
+        return {"status": "error", "message": f"Error during analysis: {str(e)}"}
+
+@eel.expose
+def start_analysis_py_binary(filename, b64_content):
+    """Analyze an archive upload sent by script.js as base64 (.zip, .tar, .gz, .tgz)"""
+    print(f"Python: Received archive '{filename}'. Encoded length: {len(b64_content)} chars.")
+
+    if not b64_content:
+        return {"status": "error", "message": f"File '{filename}' is empty or contains only whitespace."}
+
+    lower_name = filename.lower()
+
+    def write_decoded(tmp_file):
+        # Decode in slices so the raw bytes are never held in memory all at once
+        for start in range(0, len(b64_content), _B64_CHUNK_CHARS):
+            tmp_file.write(base64.b64decode(b64_content[start:start + _B64_CHUNK_CHARS]))
+
+    return _analyze_upload_file(filename, classify_log_package(lower_name),
+                                _upload_suffix(lower_name), True,
+                                write_decoded, b64_content)
+
+def _create_upload_file(suffix):
+    """Create an upload file in the app temp dir, returning (fd, path)"""
+    # mkstemp hands back the open descriptor, so the file is written without
+    # reopening it by name. The dir is created once at startup rather than
+    # checked per upload; it is only recreated if removed while running.
+    try:
+        return tempfile.mkstemp(dir=_APP_TEMP_DIR, prefix=_UPLOAD_PREFIX, suffix=suffix)
+    except FileNotFoundError:
+        if _APP_TEMP_DIR is None:
+            raise
+        os.makedirs(_APP_TEMP_DIR, exist_ok=True)
+        return tempfile.mkstemp(dir=_APP_TEMP_DIR, prefix=_UPLOAD_PREFIX, suffix=suffix)
+
+def _analyze_upload_file(filename, kind, suffix, binary, write_upload, file_content_string):
+    """Stage an upload in a temporary file via write_upload(tmp_file), analyze it, then remove it"""
     temp_file_path = ""
     try:
-        # Determine file extension for proper handling
-        file_extension = os.path.splitext(filename)[1].lower()
-        if file_extension in ['.zip', '.tar', '.gz']:
-            # Handle binary files differently
-            suffix = file_extension
-            mode = 'wb'
-            file_content = file_content_string.encode('utf-8') if isinstance(file_content_string, str) else file_content_string
-        else:
-            suffix = ".log"
-            mode = 'w+'
-            file_content = file_content_string
+        fd, temp_file_path = _create_upload_file(suffix)
+        with os.fdopen(fd, 'wb' if binary else 'w',
+                       buffering=_UPLOAD_WRITE_BUFFER,
+                       encoding=None if binary else 'utf-8',
+                       errors=None if binary else 'ignore') as tmp_file:
+            write_upload(tmp_file)
+    except Exception as e:
+        _remove_upload_file(temp_file_path)
+        print(f"Python: Error during analysis of {filename}: {e}")
+        return {"status": "error", "message": f"Error during analysis: {str(e)}"}
 
-        try:
-            # Try to use a 'temp_files' subdir relative to script_root_dir
-            app_temp_dir = os.path.join(script_root_dir, "temp_files")
-            os.makedirs(app_temp_dir, exist_ok=True)
-            with tempfile.NamedTemporaryFile(mode=mode, delete=False,
-                                           encoding='utf-8' if mode.startswith('w') else None,
-                                           errors='ignore' if mode.startswith('w') else None,
-                                           dir=app_temp_dir, suffix=suffix) as tmp_file:
-                tmp_file.write(file_content)
-                temp_file_path = tmp_file.name
-        except Exception as e_custom_temp:
-            print(f"Could not use custom temp dir '{app_temp_dir}': {e_custom_temp}. Falling back to default temp dir.")
-            with tempfile.NamedTemporaryFile(mode=mode, delete=False,
-                                           encoding='utf-8' if mode.startswith('w') else None,
-                                           errors='ignore' if mode.startswith('w') else None,
-                                           suffix=suffix) as tmp_file:
-                tmp_file.write(file_content)
-                temp_file_path = tmp_file.name
+    return _analyze_staged_file(filename, temp_file_path, kind, file_content_string)
 
+def _analyze_staged_file(filename, temp_file_path, kind, file_content_string):
+    """Analyze an upload already written to temp_file_path, removing the file afterwards"""
+    try:
         print(f"Python: Content written to temporary file: {temp_file_path}")
 
         # Check if this needs advanced analysis
-        if is_complex_log_package(filename):
+        if kind is not AnalyzerKind.STANDARD and _HAS_ADVANCED:
             print(f"Python: Detected complex log package, using advanced analysis")
-            return perform_advanced_analysis(filename, temp_file_path)
+            return perform_advanced_analysis(filename, temp_file_path, kind)
         else:
             print(f"Python: Using standard analysis")
             return perform_standard_analysis(filename, temp_file_path, file_content_string)
@@ -120,15 +259,129 @@ def start_analysis_py(filename, file_content_string):
         traceback.print_exc()
         return {"status": "error", "message": f"Error during analysis: {str(e)}"}
     finally:
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-            print(f"Python: Temporary file {temp_file_path} removed.")
+        _remove_upload_file(temp_file_path)
+
+def _remove_upload_file(temp_file_path):
+    if temp_file_path and os.path.exists(temp_file_path):
+        os.remove(temp_file_path)
+        print(f"Python: Temporary file {temp_file_path} removed.")
+
+
+# Chunked uploads for large files (see uploadInChunks in script.js): each
+# upload id maps to a _ChunkedUpload until it is finished, aborted, or left
+# idle for longer than _UPLOAD_IDLE_TIMEOUT (e.g. the browser tab was closed
+# mid-upload). The browser reaches these through upload_py below.
+_UPLOAD_CHUNK_WRITE_BUFFER = 8 << 20
+_UPLOAD_IDLE_TIMEOUT = 30 * 60  # seconds
+_active_uploads = {}
+_active_uploads_lock = threading.Lock()
+_UNKNOWN_UPLOAD_MESSAGE = "Unknown or already finished upload."
+
+class _ChunkedUpload:
+    """Staged file of one chunked upload; its lock serializes writes with closing"""
+    __slots__ = ("filename", "temp_file_path", "tmp_file", "lock", "last_active")
+
+    def __init__(self, filename, temp_file_path, tmp_file):
+        self.filename = filename
+        self.temp_file_path = temp_file_path
+        self.tmp_file = tmp_file
+        self.lock = threading.Lock()
+        self.last_active = time.monotonic()
+
+    def discard(self):
+        """Close and remove the staged file"""
+        with self.lock:
+            self.tmp_file.close()
+        _remove_upload_file(self.temp_file_path)
+
+def _expire_idle_uploads():
+    """Discard uploads that have not received a chunk within _UPLOAD_IDLE_TIMEOUT"""
+    cutoff = time.monotonic() - _UPLOAD_IDLE_TIMEOUT
+    with _active_uploads_lock:
+        expired = [upload_id for upload_id, upload in _active_uploads.items()
+                   if upload.last_active < cutoff]
+        expired = [_active_uploads.pop(upload_id) for upload_id in expired]
+    for upload in expired:
+        print(f"Python: Discarding idle chunked upload of '{upload.filename}'")
+        upload.discard()
+
+def _begin_upload(filename):
+    """Open a temporary file for a chunked upload and return its upload id"""
+    _expire_idle_uploads()
+    fd, temp_file_path = _create_upload_file(_upload_suffix(filename.lower()))
+    tmp_file = os.fdopen(fd, 'wb', buffering=_UPLOAD_CHUNK_WRITE_BUFFER)
+    upload_id = uuid.uuid4().hex
+    with _active_uploads_lock:
+        _active_uploads[upload_id] = _ChunkedUpload(filename, temp_file_path, tmp_file)
+    print(f"Python: Started chunked upload of '{filename}' to {temp_file_path}")
+    return upload_id
+
+def _append_chunk(upload_id, b64_chunk):
+    """Decode one base64 chunk and append it to the upload's temporary file"""
+    with _active_uploads_lock:
+        upload = _active_uploads.get(upload_id)
+    if upload is None:
+        return {"status": "error", "message": _UNKNOWN_UPLOAD_MESSAGE}
+    data = base64.b64decode(b64_chunk)
+    with upload.lock:
+        # The upload may have been aborted or expired since it was looked up
+        if upload.tmp_file.closed:
+            return {"status": "error", "message": _UNKNOWN_UPLOAD_MESSAGE}
+        upload.tmp_file.write(data)
+        upload.last_active = time.monotonic()
+
+def _abort_upload(upload_id):
+    """Discard a chunked upload that the browser could not complete"""
+    with _active_uploads_lock:
+        upload = _active_uploads.pop(upload_id, None)
+    if upload is not None:
+        upload.discard()
+
+def _finish_upload(upload_id):
+    """Close a chunked upload and analyze the staged file"""
+    with _active_uploads_lock:
+        upload = _active_uploads.pop(upload_id, None)
+    if upload is None:
+        return {"status": "error", "message": _UNKNOWN_UPLOAD_MESSAGE}
+
+    filename, temp_file_path = upload.filename, upload.temp_file_path
+    with upload.lock:
+        empty = upload.tmp_file.tell() == 0
+        upload.tmp_file.close()
+    if empty:
+        _remove_upload_file(temp_file_path)
+        return {"status": "error", "message": f"File '{filename}' is empty or contains only whitespace."}
+
+    # The content was never held in memory, so there is no string to check
+    # for whitespace-only input
+    return _analyze_staged_file(filename, temp_file_path, classify_log_package(filename.lower()), None)
+
+_UPLOAD_OPS = {
+    "begin": _begin_upload,
+    "append": _append_chunk,
+    "abort": _abort_upload,
+    "finish": _finish_upload,
+}
 
-def perform_standard_analysis(filename, temp_file_path, file_content_string):
-    """Perform standard single-file analysis"""
-    detected_issues = read_log_file(temp_file_path, ISSUE_PATTERNS)
+@eel.expose
+def upload_py(op, *args, _get_op=_UPLOAD_OPS.get):
+    """Single entry point for the chunked upload API: upload_py(op, *args)"""
+    handler = _get_op(op)
+    if handler is None:
+        return {"status": "error", "message": f"Unknown upload operation '{op}'."}
+    return handler(*args)
+
+def perform_standard_analysis(filename, log_source, file_content_string, _issue_patterns=ISSUE_PATTERNS):
+    """Perform standard single-file analysis on a file path or in-memory stream
+
+    file_content_string is the uploaded text used for the empty-file check,
+    or None when the upload was streamed to disk and never held in memory.
+    """
+    # ISSUE_PATTERNS is compiled once when log_analyzer is imported; it is
+    # bound as a default so each call reads it as a local
+    detected_issues = read_log_file(log_source, _issue_patterns)
 
-    if not file_content_string.strip() and not detected_issues:
+    if file_content_string is not None and not file_content_string.strip() and not detected_issues:
          return {"status": "error", "message": f"File '{filename}' is empty or contains only whitespace."}
 
     structured_report_output = get_structured_report_data(detected_issues)
@@ -151,11 +404,16 @@ def perform_standard_analysis(filename, temp_file_path, file_content_string):
         "analysis_data": enhanced_analysis_data
     }
 
-def perform_advanced_analysis(filename, temp_file_path):
-    """Perform advanced analysis for complex log packages"""
+def perform_advanced_analysis(filename, temp_file_path, kind):
+    """Perform advanced analysis for complex log packages (kind from classify_log_package)"""
     try:
+        # Package analyzers are only needed here, so they are imported on
+        # first use rather than at startup
+        from android_log_analyzer.advanced_parser import AdvancedLogParser
+        from android_log_analyzer.sprd_analyzer import SPRDLogAnalyzer
+
         # Determine which analyzer to use
-        if 'ylog' in filename.lower() or any(keyword in filename.lower() for keyword in ['sprd', 'unisoc']):
+        if kind is AnalyzerKind.SPRD:
             analyzer = SPRDLogAnalyzer()
             analysis_result = analyzer.analyze_sprd_package(Path(temp_file_path))
         else:
@@ -163,15 +421,14 @@ def perform_advanced_analysis(filename, temp_file_path):
             analysis_result = analyzer.analyze_log_package(Path(temp_file_path))
 
         # Calculate total issues
-        total_issues = 0
         if 'subsystem_analysis' in analysis_result:
-            for subsystem_data in analysis_result['subsystem_analysis'].values():
-                total_issues += len(subsystem_data.get('issues', []))
-        elif 'detailed_issues' in analysis_result:
-            total_issues = len(analysis_result['detailed_issues'])
+            total_issues = sum(len(subsystem_data.get('issues', ()))
+                               for subsystem_data in analysis_result['subsystem_analysis'].values())
+        else:
+            total_issues = len(analysis_result.get('detailed_issues', ()))
 
         # Add critical issues count
-        critical_issues = len(analysis_result.get('critical_issues', []))
+        critical_issues = len(analysis_result.get('critical_issues', ()))
 
         message = f"Advanced analysis of {filename} complete. "
         if total_issues == 0:
@@ -192,14 +449,14 @@ def perform_advanced_analysis(filename, temp_file_path):
             "analysis_data": enhanced_analysis_result
         }
 
-    except Exception as e:
-        print(f"Python: Error in advanced analysis: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # The traceback is only formatted if the record is actually emitted
+        logger.exception("Advanced analysis of %s failed", filename)
 
-        # Fallback to standard analysis
+        # Fallback to standard analysis. The upload is already on disk and
+        # was not empty, so there is no content string to check.
         print(f"Python: Falling back to standard analysis")
-        return perform_standard_analysis(filename, temp_file_path, "")
+        return perform_standard_analysis(filename, temp_file_path, None)
 
 
 @eel.expose
@@ -225,6 +482,7 @@ def smart_search_logs_py(query, log_files):
         # This is a simplified implementation - in a full version,
         # we would search across actual log files
 
+        from android_log_analyzer.intelligent.smart_search import SmartSearchEngine
         search_engine = SmartSearchEngine()
 
         # Mock search results for demonstration
@@ -266,6 +524,24 @@ def get_intelligent_features_status():
     }
 
 
+# Issue types produced by the ISSUE_PATTERNS analyzers are always priority
+# scored. Other types (e.g. from the package analyzers) are scored only if
+# their type or trigger line matches one of these keywords.
+_SCORED_ISSUE_TYPES = frozenset({"JavaCrash", "ANR", "NativeCrashHint", "SystemError", "MemoryIssue"})
+_CHEAP_PREFILTER = ('crash', 'anr', 'oom', 'fatal', 'abort', 'signal', 'panic')
+_prefilter = re.compile('|'.join(_CHEAP_PREFILTER), re.IGNORECASE).search
+
+def _split_for_scoring(issues):
+    """Split issues into (hot, cold): those to priority score and those to skip"""
+    hot, cold = [], []
+    for issue in issues:
+        issue_type = issue.get('type', '')
+        if issue_type in _SCORED_ISSUE_TYPES or _prefilter(f"{issue_type} {issue.get('trigger_line_str', '')}"):
+            hot.append(issue)
+        else:
+            cold.append(issue)
+    return hot, cold
+
 def enhance_analysis_with_intelligent_features(analysis_data):
     """
     Enhance analysis data with intelligent features if available
@@ -280,9 +556,12 @@ def enhance_analysis_with_intelligent_features(analysis_data):
         return analysis_data
 
     try:
-        # Add priority scoring to issues
+        # Add priority scoring to issues. Skipped issues are kept in their
+        # original order after the scored ones, with a zero score.
         if 'detailed_issues' in analysis_data:
-            prioritized_issues = prioritize_issues(analysis_data['detailed_issues'])
+            hot, cold = _split_for_scoring(analysis_data['detailed_issues'])
+            prioritized_issues = prioritize_issues(hot) if hot else []
+            prioritized_issues.extend({**issue, 'total_score': 0} for issue in cold)
             analysis_data['detailed_issues'] = prioritized_issues
 
         # Add intelligent features flag
@@ -296,11 +575,42 @@ def enhance_analysis_with_intelligent_features(analysis_data):
 
     return analysis_data
 
+class _EelJSON:
+    """Stand-in for the json module Eel imports as 'jsn', encoding with orjson"""
+
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+    @staticmethod
+    def dumps(obj, default=None, **kwargs):
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib still encodes
+            return json.dumps(obj, default=default, **kwargs)
+
+def _install_eel_json():
+    """Encode Eel return values with orjson when it is installed"""
+    # Every Eel release sends its messages through jsn.dumps; leave Eel
+    # untouched if that ever changes
+    if ORJSON_AVAILABLE and getattr(eel, "jsn", None) is json:
+        eel.jsn = _EelJSON()
+
 if __name__ == '__main__':
+    # Scanning the web folder and sweeping leftover uploads are only needed
+    # when the app is launched, not when this module is imported by tests
+    # or tooling
+    if _APP_TEMP_DIR is not None:
+        _remove_stale_uploads(_APP_TEMP_DIR)
+    eel.init(web_folder)
+    _install_eel_json()
     try:
         eel.start('main.html', size=(800, 700), block=True, port=8000)
     except OSError as e: 
-        if "Address already in use" in str(e) or "EADDRINUSE" in str(e): # Check for EADDRINUSE too
+        import errno
+        # Compare error codes rather than the (localized) message; Windows
+        # sockets report WSAEADDRINUSE
+        if e.errno in (errno.EADDRINUSE, getattr(errno, 'WSAEADDRINUSE', errno.EADDRINUSE)):
             print(f"Error: Port 8000 is already in use. Please close the other application or specify a different port.")
         else:
             print(f"Could not start Eel (OS Error): {e}")
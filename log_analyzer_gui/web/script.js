@@ -273,39 +273,110 @@ function resetResults() {
     filteredIssues = [];
 }
 
+// Archives are sent base64-encoded so their bytes survive the Eel bridge;
+// keep in sync with the binary extensions in main_gui.py
+const BINARY_EXTENSIONS = ['.zip', '.tar', '.gz', '.tgz'];
+
+function isBinaryUpload(fileName) {
+    const lowerName = fileName.toLowerCase();
+    return BINARY_EXTENSIONS.some(ext => lowerName.endsWith(ext));
+}
+
+// Files larger than this are streamed to Python in base64-encoded slices
+// and staged on disk there, instead of being read into memory whole
+const CHUNKED_UPLOAD_THRESHOLD = 16 * 1024 * 1024;
+const UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024;
+
+function readBlobAsBase64(blob) {
+    return new Promise((resolve, reject) => {
+        const reader = new FileReader();
+        reader.onload = (e) => {
+            // Strip the "data:...;base64," prefix from the data URL
+            const dataUrl = e.target.result;
+            resolve(dataUrl.slice(dataUrl.indexOf(',') + 1));
+        };
+        reader.onerror = () => reject(reader.error);
+        reader.readAsDataURL(blob);
+    });
+}
+
+async function uploadInChunks(file) {
+    const uploadId = await eel.upload_py('begin', file.name)();
+    try {
+        for (let start = 0; start < file.size; start += UPLOAD_CHUNK_SIZE) {
+            const chunk = await readBlobAsBase64(file.slice(start, start + UPLOAD_CHUNK_SIZE));
+            const appended = await eel.upload_py('append', uploadId, chunk)();
+            if (appended && appended.status === 'error') {
+                // The backend already dropped this upload (e.g. it expired)
+                return appended;
+            }
+        }
+    } catch (error) {
+        await eel.upload_py('abort', uploadId)();
+        throw error;
+    }
+    return await eel.upload_py('finish', uploadId)();
+}
+
+function handleAnalysisResult(result) {
+    const t = translations[currentLanguage];
+    console.log("Analysis result:", result);
+
+    hideProgress();
+
+    if (result.status === "error") {
+        showStatus(`${t.analysisError}: ${result.message}`, 'error');
+        resetResults();
+    } else if (result.status === "success" && result.analysis_data) {
+        const issueCount = result.analysis_data.detailed_issues?.length || 0;
+        showStatus(`${t.analysisComplete}. ${issueCount} issues found.`, 'success');
+        displayResults(result.analysis_data);
+    } else {
+        showStatus('Unexpected response from analyzer', 'error');
+        resetResults();
+    }
+}
+
+function handleAnalysisError(error) {
+    const t = translations[currentLanguage];
+    console.error("Analysis error:", error);
+    hideProgress();
+    showStatus(`${t.analysisError}: ${error.message}`, 'error');
+    resetResults();
+}
+
 async function processFile(file) {
-    const statusElement = document.getElementById('analysisStatus');
     const selectFileBtn = document.getElementById('selectFileBtn');
-    const t = translations[currentLanguage];
 
+    if (file.size > CHUNKED_UPLOAD_THRESHOLD) {
+        try {
+            console.log(`Analyzing ${file.name} (chunked upload)...`);
+            handleAnalysisResult(await uploadInChunks(file));
+        } catch (error) {
+            handleAnalysisError(error);
+        } finally {
+            selectFileBtn.disabled = false;
+        }
+        return;
+    }
 
+    const binaryUpload = isBinaryUpload(file.name);
     const reader = new FileReader();
     reader.onload = async (e) => {
-        const fileContent = e.target.result;
+        let fileContent = e.target.result;
+        if (binaryUpload) {
+            // Strip the "data:...;base64," prefix from the data URL
+            fileContent = fileContent.slice(fileContent.indexOf(',') + 1);
+        }
 
         try {
             console.log(`Analyzing ${file.name}...`);
-            const result = await eel.start_analysis_py(file.name, fileContent)();
-            console.log("Analysis result:", result);
-
-            hideProgress();
-
-            if (result.status === "error") {
-                showStatus(`${t.analysisError}: ${result.message}`, 'error');
-                resetResults();
-            } else if (result.status === "success" && result.analysis_data) {
-                const issueCount = result.analysis_data.detailed_issues?.length || 0;
-                showStatus(`${t.analysisComplete}. ${issueCount} issues found.`, 'success');
-                displayResults(result.analysis_data);
-            } else {
-                showStatus('Unexpected response from analyzer', 'error');
-                resetResults();
-            }
+            const result = binaryUpload
+                ? await eel.start_analysis_py_binary(file.name, fileContent)()
+                : await eel.start_analysis_py(file.name, fileContent)();
+            handleAnalysisResult(result);
         } catch (error) {
-            console.error("Analysis error:", error);
-            hideProgress();
-            showStatus(`${t.analysisError}: ${error.message}`, 'error');
-            resetResults();
+            handleAnalysisError(error);
         } finally {
             selectFileBtn.disabled = false;
         }
@@ -317,7 +388,11 @@ async function processFile(file) {
         selectFileBtn.disabled = false;
     };
 
-    reader.readAsText(file);
+    if (binaryUpload) {
+        reader.readAsDataURL(file);
+    } else {
+        reader.readAsText(file);
+    }
 }
 
 function showStatus(message, type) {
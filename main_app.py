@@ -8,10 +8,15 @@ It provides both GUI and CLI interfaces.
 
 import sys
 import os
-import threading
+import json
+import multiprocessing
+import queue
+import shlex
 import subprocess
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import json
 
 # Try to import GUI components
 GUI_AVAILABLE = True
@@ -23,12 +28,13 @@ except ImportError:
     print("Warning: GUI components not available. Running in CLI-only mode.")
 
 # Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _APP_DIR)
 
 try:
     from android_log_analyzer import read_log_file, generate_report, get_structured_report_data
     from android_log_analyzer.config import ConfigManager
-    from android_log_analyzer.utils import PerformanceMonitor
+    from android_log_analyzer.utils import PerformanceMonitor, dump_json
     ANALYZER_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import analyzer: {e}")
@@ -38,6 +44,18 @@ except ImportError as e:
 class AndroidLogAnalyzerGUI:
     """Simple GUI for Android Log Analyzer"""
     
+    # Extra detail line shown for some issue types: field name and its label
+    EXTRA_FIELD_BY_TYPE = {
+        "ANR": "process_name",
+        "MemoryIssue": "oom_reason",
+        "NativeCrashHint": "signal_info",
+    }
+    LABEL_BY_TYPE = {
+        "ANR": "Process",
+        "MemoryIssue": "Reason",
+        "NativeCrashHint": "Signal",
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Android Log Analyzer v0.2.0")
@@ -50,12 +68,27 @@ class AndroidLogAnalyzerGUI:
         self.setup_ui()
         self.current_file = None
         self.analysis_results = None
+        self._cached_export_path = None
+        self._cached_export_stat = None
+        
+        # Analyses run on a pool created once, rather than a new thread per click
+        self._pool = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2),
+                                        thread_name_prefix="log-analysis")
+        
+        # Command line tab, built on first use
+        self.cli_tab = None
+        self._cli_process = None
+        self._cli_queue = queue.Queue()
         
     def setup_ui(self):
         """Setup the user interface"""
+        # Analysis and command line views share one notebook
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
         # Main frame
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(main_frame, text="Analysis")
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
@@ -91,7 +124,13 @@ class AndroidLogAnalyzerGUI:
         export_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         clear_btn = ttk.Button(button_frame, text="Clear", command=self.clear_results)
-        clear_btn.pack(side=tk.LEFT)
+        clear_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Exports are compact unless pretty printing is requested
+        self.pretty_json_var = tk.BooleanVar(value=False)
+        pretty_check = ttk.Checkbutton(button_frame, text="Pretty JSON",
+                                       variable=self.pretty_json_var)
+        pretty_check.pack(side=tk.LEFT)
         
         # Results area
         results_frame = ttk.LabelFrame(main_frame, text="Analysis Results", padding="5")
@@ -99,8 +138,10 @@ class AndroidLogAnalyzerGUI:
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(0, weight=1)
         
+        # Read-only report view: no undo stack, and only _show_results edits it
         self.results_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD, 
-                                                     width=80, height=25)
+                                                     width=80, height=25,
+                                                     undo=False, state=tk.DISABLED)
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Status bar
@@ -168,84 +209,111 @@ class AndroidLogAnalyzerGUI:
         
         # Run analysis in a separate thread to avoid blocking UI
         self.status_var.set("Analyzing...")
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Analyzing log file, please wait...\n")
+        self._show_results("Analyzing log file, please wait...\n")
         
-        thread = threading.Thread(target=self._run_analysis)
-        thread.daemon = True
-        thread.start()
+        future = self._pool.submit(self._run_analysis, self.current_file)
+        # Done callbacks fire on the worker thread; hand the result to Tk
+        future.add_done_callback(lambda f: self.root.after(0, self._handle_analysis, f))
+    
+    @staticmethod
+    def _run_analysis(filepath):
+        """Run the actual analysis (in a pool worker thread)"""
+        issues = read_log_file(filepath)
+        return issues, get_structured_report_data(issues)
     
-    def _run_analysis(self):
-        """Run the actual analysis (in background thread)"""
+    def _handle_analysis(self, future):
+        """Show a finished analysis (in the main thread)"""
         try:
-            # Perform analysis
-            issues = read_log_file(self.current_file)
-            self.analysis_results = get_structured_report_data(issues)
-            
-            # Update UI in main thread
-            self.root.after(0, self._display_results, issues)
-            
+            issues, self.analysis_results = future.result()
         except Exception as e:
-            error_msg = f"Analysis failed: {str(e)}"
-            self.root.after(0, self._display_error, error_msg)
+            self._display_error(f"Analysis failed: {str(e)}")
+            return
+        
+        self._display_results(issues)
     
     def _display_results(self, issues):
         """Display analysis results"""
-        self.results_text.delete(1.0, tk.END)
-        
         if not issues:
-            self.results_text.insert(tk.END, "✅ No issues found in the log file.\n")
+            self._show_results("✅ No issues found in the log file.\n")
             self.status_var.set("Analysis complete - No issues found")
             return
         
+        # The report is assembled as one string and inserted in a single
+        # call; per-line inserts make Tk re-layout the growing buffer each time
+        parts = []
+        
         # Display summary
         summary = self.analysis_results.get("summary_counts", {})
-        self.results_text.insert(tk.END, "📊 ANALYSIS SUMMARY\n")
-        self.results_text.insert(tk.END, "=" * 50 + "\n")
+        parts.append("📊 ANALYSIS SUMMARY\n")
+        parts.append("=" * 50 + "\n")
         
         total_issues = sum(summary.values())
-        self.results_text.insert(tk.END, f"Total Issues Found: {total_issues}\n\n")
+        parts.append(f"Total Issues Found: {total_issues}\n\n")
         
-        for issue_type, count in summary.items():
-            self.results_text.insert(tk.END, f"  {issue_type}: {count}\n")
+        # Most frequent issue types first
+        parts.append("".join([f"  {issue_type}: {count}\n"
+                              for issue_type, count in Counter(summary).most_common()]))
         
-        self.results_text.insert(tk.END, "\n" + "=" * 50 + "\n\n")
+        parts.append("\n" + "=" * 50 + "\n\n")
         
         # Display detailed issues
-        self.results_text.insert(tk.END, "🔍 DETAILED ISSUES\n")
-        self.results_text.insert(tk.END, "=" * 50 + "\n\n")
+        parts.append("🔍 DETAILED ISSUES\n")
+        parts.append("=" * 50 + "\n\n")
         
+        extra_field_by_type = self.EXTRA_FIELD_BY_TYPE
         for i, issue in enumerate(issues, 1):
             issue_type = issue.get("type", "Unknown")
             trigger = issue.get("trigger_line_str", "No details available")
             
-            self.results_text.insert(tk.END, f"Issue #{i}: {issue_type}\n")
-            self.results_text.insert(tk.END, f"Details: {trigger}\n")
+            parts.append(f"Issue #{i}: {issue_type}\n")
+            parts.append(f"Details: {trigger}\n")
             
             # Add specific details based on issue type
-            if issue_type == "ANR" and "process_name" in issue:
-                self.results_text.insert(tk.END, f"Process: {issue['process_name']}\n")
-            elif issue_type == "MemoryIssue" and "oom_reason" in issue:
-                self.results_text.insert(tk.END, f"Reason: {issue['oom_reason']}\n")
-            elif issue_type == "NativeCrashHint" and "signal_info" in issue:
-                self.results_text.insert(tk.END, f"Signal: {issue['signal_info']}\n")
+            field = extra_field_by_type.get(issue_type)
+            if field and field in issue:
+                parts.append(f"{self.LABEL_BY_TYPE[issue_type]}: {issue[field]}\n")
             
-            self.results_text.insert(tk.END, "\n" + "-" * 40 + "\n\n")
+            parts.append("\n" + "-" * 40 + "\n\n")
+        
+        self._show_results("".join(parts))
         
         self.status_var.set(f"Analysis complete - {total_issues} issues found")
     
     def _display_error(self, error_msg):
         """Display error message"""
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"❌ {error_msg}\n")
+        self._show_results(f"❌ {error_msg}\n")
         self.status_var.set("Analysis failed")
     
+    def _show_results(self, text):
+        """Replace the results view contents in one edit"""
+        self.results_text.configure(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        if text:
+            self.results_text.insert(tk.END, text)
+        self.results_text.mark_set(tk.INSERT, tk.END)
+        self.results_text.configure(state=tk.DISABLED)
+        self.results_text.update_idletasks()
+    
     def export_json(self):
         """Export results to JSON"""
         if not self.analysis_results:
             messagebox.showwarning("Warning", "No analysis results to export.")
             return
         
+        results = self.analysis_results
+        if '_exported_to' in results:
+            # The results were released after an earlier export; reload them
+            # from that file so they can be written again with this export's
+            # formatting
+            results = self._load_exported_results()
+            if results is None:
+                messagebox.showwarning(
+                    "Warning",
+                    "The analysis results were released after exporting to "
+                    f"{self._cached_export_path}, and that file has since been "
+                    "moved or changed.\n\nPlease re-run the analysis to export again.")
+                return
+        
         filename = filedialog.asksaveasfilename(
             title="Save Analysis Results",
             defaultextension=".json",
@@ -254,8 +322,15 @@ class AndroidLogAnalyzerGUI:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.analysis_results, f, indent=2, ensure_ascii=False)
+                with open(filename, 'wb') as f:
+                    dump_json(results, f, indent=self.pretty_json_var.get())
+                
+                # The report is on disk and rendered in the text view, so
+                # the dict does not need to stay in memory as well
+                stat = os.stat(filename)
+                self._cached_export_path = filename
+                self._cached_export_stat = (stat.st_size, stat.st_mtime_ns)
+                self.analysis_results = {'_exported_to': filename}
                 
                 messagebox.showinfo("Success", f"Results exported to {filename}")
                 self.status_var.set(f"Exported to {os.path.basename(filename)}")
@@ -263,21 +338,135 @@ class AndroidLogAnalyzerGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
+    def _load_exported_results(self):
+        """Reload results released after an export, or None if that file was moved or changed"""
+        try:
+            stat = os.stat(self._cached_export_path)
+            if (stat.st_size, stat.st_mtime_ns) != self._cached_export_stat:
+                return None
+            with open(self._cached_export_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
     def clear_results(self):
         """Clear analysis results"""
-        self.results_text.delete(1.0, tk.END)
+        self._show_results("")
         self.analysis_results = None
+        self._cached_export_path = None
+        self._cached_export_stat = None
         self.status_var.set("Ready")
     
     def open_cli(self):
-        """Open command line interface"""
+        """Open the command line tab"""
+        if self.cli_tab is None:
+            self._setup_cli_tab()
+        self.notebook.select(self.cli_tab)
+        self.cli_args_entry.focus_set()
+    
+    def _setup_cli_tab(self):
+        """Setup the command line tab"""
+        self.cli_tab = ttk.Frame(self.notebook, padding="10")
+        self.cli_tab.columnconfigure(1, weight=1)
+        self.cli_tab.rowconfigure(1, weight=1)
+        self.notebook.add(self.cli_tab, text="Command Line")
+        
+        ttk.Label(self.cli_tab, text="Arguments:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        
+        self.cli_args_var = tk.StringVar(value="--help")
+        self.cli_args_entry = ttk.Entry(self.cli_tab, textvariable=self.cli_args_var, width=50)
+        self.cli_args_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=5)
+        self.cli_args_entry.bind("<Return>", lambda event: self.run_cli())
+        
+        self.cli_run_btn = ttk.Button(self.cli_tab, text="Run", command=self.run_cli)
+        self.cli_run_btn.grid(row=0, column=2, padx=(5, 0), pady=5)
+        
+        self.cli_output = scrolledtext.ScrolledText(self.cli_tab, wrap=tk.WORD,
+                                                    width=80, height=25, undo=False)
+        self.cli_output.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=10)
+    
+    def run_cli(self):
+        """Run the analyzer CLI with the entered arguments"""
+        if self._cli_process is not None and self._cli_process.poll() is None:
+            return
+        
+        windows = sys.platform.startswith('win')
         try:
-            if sys.platform.startswith('win'):
-                subprocess.Popen(['cmd', '/k', 'echo Android Log Analyzer CLI Mode'])
-            else:
-                subprocess.Popen(['gnome-terminal', '--', 'bash'])
+            args = shlex.split(self.cli_args_var.get(), posix=not windows)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid arguments: {str(e)}")
+            return
+        if windows:
+            # Non-POSIX splitting keeps backslashes but also the quotes
+            args = [arg.strip('"') for arg in args]
+        if not args:
+            args = ["--help"]
+        
+        if getattr(sys, 'frozen', False):
+            # The bundled executable runs the CLI itself when given arguments
+            cmd = [sys.executable, *args]
+        else:
+            cmd = [sys.executable, '-m', 'android_log_analyzer', *args]
+        
+        env = dict(os.environ, PYTHONIOENCODING='utf-8',
+                   PYTHONPATH=os.pathsep.join(filter(None, (_APP_DIR, os.environ.get('PYTHONPATH')))))
+        kwargs = {'creationflags': subprocess.CREATE_NO_WINDOW} if windows else {}
+        
+        self.cli_output.delete(1.0, tk.END)
+        self.cli_output.insert(tk.END, f"> {' '.join(args)}\n")
+        try:
+            self._cli_process = subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                bufsize=1 << 16, text=True, encoding='utf-8', errors='replace', env=env, **kwargs)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open CLI: {str(e)}")
+            self.cli_output.insert(tk.END, f"❌ Failed to start CLI: {str(e)}\n")
+            return
+        
+        self.cli_run_btn.config(state=tk.DISABLED)
+        self.status_var.set("Running command...")
+        threading.Thread(target=self._read_cli_output, args=(self._cli_process,),
+                         name="cli-reader", daemon=True).start()
+        self.root.after(50, self._pump_cli_output)
+    
+    def _read_cli_output(self, process):
+        """Forward CLI output lines to the queue (in the reader thread)"""
+        for line in process.stdout:
+            self._cli_queue.put(line)
+        process.stdout.close()
+        self._cli_queue.put(None)
+    
+    def _pump_cli_output(self):
+        """Move queued CLI output into the tab (in the main thread)"""
+        lines = []
+        finished = False
+        try:
+            while True:
+                line = self._cli_queue.get_nowait()
+                if line is None:
+                    finished = True
+                    break
+                lines.append(line)
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.cli_output.insert(tk.END, "".join(lines))
+            self.cli_output.see(tk.END)
+        
+        if not finished:
+            self.root.after(50, self._pump_cli_output)
+            return
+        
+        returncode = self._cli_process.wait()
+        self.cli_output.insert(tk.END, f"\n[exit code {returncode}]\n")
+        self.cli_output.see(tk.END)
+        self.cli_run_btn.config(state=tk.NORMAL)
+        self.status_var.set("Command finished")
+    
+    def close_cli(self):
+        """Stop a running CLI command"""
+        if self._cli_process is not None and self._cli_process.poll() is None:
+            self._cli_process.terminate()
     
     def show_settings(self):
         """Show settings dialog"""
@@ -303,6 +492,9 @@ Features:
 
 def main():
     """Main application entry point"""
+    # Let process-pool workers of the bundled executable start up as workers
+    multiprocessing.freeze_support()
+
     # Check if running with command line arguments
     if len(sys.argv) > 1:
         # CLI mode
@@ -338,6 +530,9 @@ def main():
             root.mainloop()
         except KeyboardInterrupt:
             pass
+        finally:
+            app.close_cli()
+            app._pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
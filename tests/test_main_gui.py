@@ -0,0 +1,99 @@
+"""Tests for the Eel GUI backend's analysis helpers."""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+GUI_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "log_analyzer_gui")
+
+try:
+    import eel  # noqa: F401
+
+    sys.path.insert(0, GUI_DIR)
+    import main_gui
+
+    GUI_AVAILABLE = True
+except ImportError:
+    GUI_AVAILABLE = False
+
+from android_log_analyzer.log_analyzer import get_structured_report_data, read_log_file
+
+
+@unittest.skipUnless(GUI_AVAILABLE, "eel is not installed")
+class TestPriorityPrefilter(unittest.TestCase):
+    """Test cases for the priority scoring prefilter."""
+
+    def test_known_types_are_never_cold(self):
+        """Test that every ISSUE_PATTERNS issue type is scored."""
+        issues = [
+            {"type": issue_type, "trigger_line_str": "Message: Low memory"}
+            for issue_type in ("JavaCrash", "ANR", "NativeCrashHint", "SystemError", "MemoryIssue")
+        ]
+        for path in ("sample.log", "test.log"):
+            log_path = os.path.join(os.path.dirname(GUI_DIR), path)
+            issues += get_structured_report_data(read_log_file(log_path))["detailed_issues"]
+
+        hot, cold = main_gui._split_for_scoring(issues)
+        self.assertEqual(cold, [])
+        self.assertEqual(len(hot), len(issues))
+
+    def test_unknown_types_are_prefiltered(self):
+        """Test that unknown issue types are scored only on a keyword match."""
+        quiet = {"type": "Subsystem", "trigger_line_str": "wifi: scan finished"}
+        loud = {"type": "Subsystem", "trigger_line_str": "modem: FATAL error"}
+        hot, cold = main_gui._split_for_scoring([quiet, loud])
+        self.assertEqual(hot, [loud])
+        self.assertEqual(cold, [quiet])
+
+
+
+@unittest.skipUnless(GUI_AVAILABLE, "eel is not installed")
+class TestChunkedUpload(unittest.TestCase):
+    """Test cases for the chunked upload API."""
+
+    def test_append_to_unknown_upload_returns_error(self):
+        """Test that appending to an unknown or aborted upload reports an error."""
+        chunk = base64.b64encode(b"data").decode()
+        self.assertEqual(main_gui.upload_py("append", "missing", chunk)["status"], "error")
+
+        upload_id = main_gui.upload_py("begin", "aborted.log")
+        main_gui.upload_py("abort", upload_id)
+        self.assertEqual(main_gui.upload_py("append", upload_id, chunk)["status"], "error")
+
+    def test_idle_uploads_expire(self):
+        """Test that beginning an upload discards uploads left idle too long."""
+        idle_id = main_gui.upload_py("begin", "idle.log")
+        idle_path = main_gui._active_uploads[idle_id].temp_file_path
+        main_gui._active_uploads[idle_id].last_active -= main_gui._UPLOAD_IDLE_TIMEOUT + 1
+
+        active_id = main_gui.upload_py("begin", "active.log")
+        self.addCleanup(main_gui.upload_py, "abort", active_id)
+        self.assertNotIn(idle_id, main_gui._active_uploads)
+        self.assertFalse(os.path.exists(idle_path))
+        self.assertIn(active_id, main_gui._active_uploads)
+
+
+    def test_remove_stale_uploads_keeps_recent_entries(self):
+        """Test that only staged uploads older than the age limit are removed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            old = os.path.join(temp_dir, main_gui._UPLOAD_PREFIX + "old.log")
+            recent = os.path.join(temp_dir, main_gui._UPLOAD_PREFIX + "recent.log")
+            other = os.path.join(temp_dir, "keep.txt")
+            old_tree = os.path.join(temp_dir, main_gui._UPLOAD_PREFIX + "old_extracted")
+            os.makedirs(os.path.join(old_tree, "sub"))
+            for path in (old, recent, other):
+                open(path, "w").close()
+            stale = time.time() - main_gui._STALE_UPLOAD_AGE - 60
+            for path in (old, other, old_tree):
+                os.utime(path, (stale, stale))
+
+            main_gui._remove_stale_uploads(temp_dir)
+            self.assertEqual(sorted(os.listdir(temp_dir)), sorted(["keep.txt", os.path.basename(recent)]))
+
+
+if __name__ == "__main__":
+    unittest.main()